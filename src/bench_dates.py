@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""날짜 표현 파서 검증 + 처리량 벤치마크
+
+data/date_expressions.json의 문장마다 기대한 날짜/기간이 나오는지 확인하고,
+train.json 질문으로 기존 extract_date_from_question 방식과 처리량을 비교한다.
+사용법: cd src && python bench_dates.py [반복횟수]
+"""
+import json
+import os
+import re
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+from campus_dates import DateParser
+from campus_router import IntentRouter, WEEKDAYS
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data")
+CORPUS_FILE = os.path.join(DATA_DIR, "date_expressions.json")
+TRAIN_FILE = os.path.join(DATA_DIR, "train.json")
+
+router = IntentRouter()
+
+
+def legacy_extract(question, today):
+    """기존 방식: 라우팅 결과로 상대 날짜/요일을 보고, 없으면 패턴을 매번 re.search"""
+    route = router.route(question)
+    if route.has("date_yesterday"):
+        return today - timedelta(days=1)
+    if route.has("date_today"):
+        return None
+    if route.has("date_tomorrow"):
+        return today + timedelta(days=1)
+    if route.has("date_day_after_tomorrow"):
+        return today + timedelta(days=2)
+    matched_weekdays = route.keywords("weekday")
+    for weekday_num, weekday_name in enumerate(WEEKDAYS):
+        if weekday_name in matched_weekdays:
+            days_ahead = weekday_num - today.weekday()
+            if days_ahead <= 0:
+                days_ahead += 7
+            return today + timedelta(days=days_ahead)
+    match = re.search(r'(\d{1,2})월\s*(\d{1,2})일', question)
+    if match:
+        return f"{today.year}.{match.group(1).zfill(2)}.{match.group(2).zfill(2)}"
+    for pattern in [r'(\d{4})[.\-/](\d{1,2})[.\-/](\d{1,2})', r'(\d{1,2})[.\-/](\d{1,2})']:
+        match = re.search(pattern, question)
+        if match:
+            return ".".join(match.groups())
+    return None
+
+
+def check_corpus(parser):
+    with open(CORPUS_FILE, "r", encoding="utf-8") as f:
+        corpus = json.load(f)
+    today = datetime.strptime(corpus["today"], "%Y-%m-%d").date()
+
+    failures = []
+    for case in corpus["cases"]:
+        found = parser.parse(case["text"], today)
+        got = (str(found.start), str(found.end), found.kind) if found else (None, None, None)
+        if got != (case["start"], case["end"], case["kind"]):
+            failures.append((case, got))
+    return corpus["cases"], failures
+
+
+def measure(func, questions, repeat):
+    """질문 1개당 평균 시간 (µs)"""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for question in questions:
+            func(question)
+    return (time.perf_counter() - started) / (repeat * len(questions)) * 1e6
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    parser = DateParser()
+    cases, failures = check_corpus(parser)
+
+    with open(TRAIN_FILE, "r", encoding="utf-8") as f:
+        questions = [item["question"] for item in json.load(f)] + [case["text"] for case in cases]
+    today = date.today()
+
+    print(f"📊 날짜 표현 파서 벤치마크 (질문 {len(questions)}개, 반복 {repeat}회)")
+    print("=" * 60)
+    legacy = measure(lambda q: legacy_extract(q, today), questions, repeat)
+    parsed = measure(lambda q: parser.parse(q, today), questions, repeat)
+    print(f"  {'기존 extract_date_from_question':<30} {legacy:8.2f} µs/질문")
+    print(f"  {'DateParser (단일 정규식)':<30} {parsed:8.2f} µs/질문  (x{legacy / parsed:.1f})")
+    print(f"  {'DateParser 처리량':<30} {1e6 / parsed:8.0f} 질문/초")
+
+    if failures:
+        print(f"\n❌ 날짜 코퍼스 불일치 {len(failures)}/{len(cases)}건")
+        for case, got in failures:
+            print(f"  {case['text']}: 기대 {case['start']}~{case['end']} ({case['kind']}), 결과 {got}")
+    else:
+        print(f"\n✅ 날짜 코퍼스 {len(cases)}건 모두 일치")
+
+
+if __name__ == "__main__":
+    main()
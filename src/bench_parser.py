@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""식단/공지 HTML 파싱 마이크로 벤치마크
+
+저장된 fixture HTML(../data/fixtures)로 파서 조합별 파싱 시간을 비교한다.
+사용법: cd src && python bench_parser.py [반복횟수]
+"""
+import os
+import sys
+import time
+
+from campus_parser import parse_menu_table, parse_notice_list
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "fixtures")
+
+FIXTURES = [
+    ("식단", "menu_2025.06.18.html", parse_menu_table),
+    ("공지", "notice_page1.html", parse_notice_list),
+]
+
+
+def available_parsers():
+    parsers = ["html.parser"]
+    try:
+        import lxml  # noqa: F401
+        parsers.append("lxml")
+    except ImportError:
+        print("⚠️ lxml 미설치 - html.parser만 측정합니다.")
+    return parsers
+
+
+def measure(func, *args, repeat=200):
+    """1회 평균 실행 시간 (ms)"""
+    func(*args)  # 워밍업
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func(*args)
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    parsers = available_parsers()
+
+    print(f"📊 HTML 파싱 벤치마크 (반복 {repeat}회)")
+    print("=" * 60)
+
+    for label, filename, parse in FIXTURES:
+        with open(os.path.join(FIXTURE_DIR, filename), "rb") as f:
+            body = f.read()
+
+        # 기존 방식: 매번 str 디코딩 + html.parser로 전체 트리
+        baseline_result = parse(body.decode("utf-8"), "html.parser", False)
+        baseline = measure(lambda: parse(body.decode("utf-8"), "html.parser", False), repeat=repeat)
+
+        print(f"\n[{label}] {filename} ({len(body) / 1024:.1f} KB)")
+        print(f"  {'html.parser / 전체 트리 (기존)':<32} {baseline:8.3f} ms")
+
+        for parser in parsers:
+            for strainer in (False, True):
+                if parser == "html.parser" and not strainer:
+                    continue
+                result = parse(body, parser, strainer)
+                if result != baseline_result:
+                    print(f"  ❌ {parser} (strainer={strainer}) 결과 불일치")
+                    continue
+                elapsed = measure(parse, body, parser, strainer, repeat=repeat)
+                name = f"{parser} / {'하위 트리' if strainer else '전체 트리'}"
+                print(f"  {name:<32} {elapsed:8.3f} ms  (x{baseline / elapsed:.1f})")
+
+
+if __name__ == "__main__":
+    main()
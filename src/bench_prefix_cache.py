@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""시스템 프롬프트 KV 캐시 재사용 벤치마크
+
+train.json 질문마다 정적 지식 컨텍스트로 프롬프트를 만들고
+(1) 전체 프롬프트 prefill, (2) 접두사 KV 캐시 사본 + 나머지 prefill,
+(3) 첫 토큰까지 시간(generate max_new_tokens=1)을 캐시 없이/있이 비교한다.
+GPU와 모델 가중치가 필요하다.
+사용법: cd src && python bench_prefix_cache.py [질문 수] [모델 이름]
+"""
+import json
+import os
+import sys
+import time
+
+import torch
+
+TRAIN_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "train.json")
+
+
+def synchronize():
+    if torch.cuda.is_available():
+        torch.cuda.synchronize()
+
+
+def timed_ms(func):
+    synchronize()
+    started = time.perf_counter()
+    result = func()
+    synchronize()
+    return (time.perf_counter() - started) * 1000, result
+
+
+def main():
+    limit = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    model_name = sys.argv[2] if len(sys.argv) > 2 else "Qwen/Qwen3-14B-AWQ"
+    with open(TRAIN_FILE, "r", encoding="utf-8") as f:
+        questions = [item["question"] for item in json.load(f)][:limit]
+
+    from chatbot_model import CompleteCampusChatBot
+    chatbot = CompleteCampusChatBot(model_name=model_name)
+    model, cache = chatbot.model, chatbot.prefix_cache
+    if cache.past is None:
+        print("❌ 접두사 KV 캐시를 만들지 못했습니다 (CAMPUS_PREFIX_CACHE=0 또는 모델 미지원)")
+        return
+
+    totals = {"full": 0.0, "copy": 0.0, "reuse": 0.0, "ttft_full": 0.0, "ttft_reuse": 0.0}
+    prompt_tokens = 0
+    generate_kwargs = {"max_new_tokens": 1, "do_sample": False, "pad_token_id": chatbot.tokenizer.eos_token_id}
+
+    for i, question in enumerate(questions):
+        context, context_ids = chatbot.create_rich_context(
+            [("관련_정보", chatbot.knowledge_base.search_passages(question))], with_ids=True)
+        inputs = cache.inputs(chatbot.create_prompt_suffix(question, context), context, context_ids)
+        input_ids = inputs["input_ids"]
+        prompt_tokens += input_ids.shape[1]
+
+        with torch.no_grad():
+            full_ms, _ = timed_ms(lambda: model(input_ids=input_ids, use_cache=True))
+            copy_ms, past = timed_ms(cache.past_for_request)
+            reuse_ms, _ = timed_ms(lambda: model(input_ids=input_ids[:, len(cache.prefix_ids):],
+                                                 past_key_values=past, use_cache=True))
+            ttft_full, _ = timed_ms(lambda: model.generate(**inputs, **generate_kwargs))
+            ttft_reuse, _ = timed_ms(lambda: model.generate(**inputs, past_key_values=cache.past_for_request(),
+                                                            **generate_kwargs))
+        if i == 0:
+            continue  # 첫 질문은 CUDA 커널 준비 시간이 섞이므로 제외
+        for name, value in (("full", full_ms), ("copy", copy_ms), ("reuse", reuse_ms),
+                            ("ttft_full", ttft_full), ("ttft_reuse", ttft_reuse)):
+            totals[name] += value
+
+    n = max(len(questions) - 1, 1)
+    print(f"\n📊 시스템 프롬프트 KV 캐시 벤치마크 ({model_name}, 질문 {n}개)")
+    print("=" * 60)
+    print(f"  접두사 토큰 / 평균 프롬프트 토큰      {len(cache.prefix_ids):6d} / {prompt_tokens / len(questions):.0f}")
+    print(f"  전체 prefill                          {totals['full'] / n:9.2f} ms")
+    print(f"  캐시 사본 + 나머지 prefill            {(totals['copy'] + totals['reuse']) / n:9.2f} ms"
+          f"  (사본 {totals['copy'] / n:.2f} ms)")
+    print(f"  첫 토큰까지 (캐시 없음)               {totals['ttft_full'] / n:9.2f} ms")
+    print(f"  첫 토큰까지 (접두사 캐시)             {totals['ttft_reuse'] / n:9.2f} ms"
+          f"  (x{totals['ttft_full'] / max(totals['ttft_reuse'], 1e-9):.2f})")
+
+
+if __name__ == "__main__":
+    main()
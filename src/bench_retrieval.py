@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""정적 지식 검색 벤치마크 (BM25 vs 임베딩)
+
+train.json 질문들로 질문당 검색 시간을 잰다. 임베딩은 질문 인코딩과
+행렬-벡터 곱 + top-k 선택을 따로 측정한다.
+사용법: cd src && python bench_retrieval.py [질문 수]
+"""
+import json
+import os
+import sys
+import time
+
+from campus_embeddings import EmbeddingIndex
+
+TRAIN_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "train.json")
+SAMPLE_QUESTIONS = ["졸업 논문 대신 뭐 내도 돼?", "영어 졸업인증 기준", "토익 몇 점이면 대학영어 면제야?"]
+
+
+def per_call_ms(func, items):
+    started = time.perf_counter()
+    results = [func(item) for item in items]
+    return (time.perf_counter() - started) / len(items) * 1000, results
+
+
+def main():
+    limit = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    with open(TRAIN_FILE, "r", encoding="utf-8") as f:
+        questions = [item["question"] for item in json.load(f)][:limit]
+
+    from chatbot_model import CompleteCampusKnowledgeBase
+    kb = CompleteCampusKnowledgeBase()
+
+    started = time.perf_counter()
+    index = EmbeddingIndex(kb.passages)
+    load_ms = (time.perf_counter() - started) * 1000
+
+    print(f"📊 정적 지식 검색 벤치마크 (passage {len(kb.passages)}개, 질문 {len(questions)}개)")
+    print("=" * 60)
+    print(f"  임베딩 색인 로드 (mmap)             {load_ms:9.2f} ms")
+
+    bm25_ms, _ = per_call_ms(lambda q: kb.passage_index.search(q, k=3), questions)
+    encode_ms, vectors = per_call_ms(lambda q: index.encoder.encode([q])[0], questions)
+    topk_ms, _ = per_call_ms(lambda v: index.search_vector(v, k=3), vectors)
+    print(f"  BM25 검색                           {bm25_ms:9.3f} ms/질문")
+    print(f"  임베딩 질문 인코딩                  {encode_ms:9.3f} ms/질문")
+    print(f"  임베딩 행렬-벡터 곱 + top-k         {topk_ms:9.3f} ms/질문")
+
+    for question in SAMPLE_QUESTIONS:
+        print(f"\n[{question}]")
+        print(f"  BM25:   {[p.path for _, p in kb.passage_index.search(question, k=3)]}")
+        print(f"  임베딩: {[p.path for _, p in index.search(question, k=3)]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""의도 라우터 마이크로 벤치마크
+
+train.json의 질문들로 기존 any() 키워드 검사와 IntentRouter를 비교하고,
+두 방식의 의도 판정이 같은지 확인한다.
+사용법: cd src && python bench_router.py [반복횟수]
+"""
+import json
+import os
+import sys
+import time
+
+from campus_router import INTENT_KEYWORDS, IntentRouter
+
+TRAIN_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "train.json")
+
+
+def legacy_intents(question):
+    """기존 방식: 의도마다 소문자 질문에 대해 any(word in ...) 검사"""
+    question_lower = question.lower()
+    intents = set()
+    for intent, keywords in INTENT_KEYWORDS.items():
+        if any(word in question_lower for word in keywords):
+            intents.add(intent)
+    return intents
+
+
+def measure(func, questions, repeat):
+    """질문 1개당 평균 시간 (µs)"""
+    for question in questions:
+        func(question)  # 워밍업
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for question in questions:
+            func(question)
+    return (time.perf_counter() - started) / (repeat * len(questions)) * 1e6
+
+
+def main():
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    with open(TRAIN_FILE, "r", encoding="utf-8") as f:
+        questions = [item["question"] for item in json.load(f)]
+
+    started = time.perf_counter()
+    router = IntentRouter()
+    build_ms = (time.perf_counter() - started) * 1000
+
+    mismatches = [q for q in questions if legacy_intents(q) != set(router.route(q).intents)]
+
+    print(f"📊 의도 라우터 벤치마크 (질문 {len(questions)}개, 반복 {repeat}회)")
+    print("=" * 60)
+    print(f"  라우터 컴파일                    {build_ms:8.3f} ms")
+    legacy = measure(legacy_intents, questions, repeat)
+    routed = measure(router.route, questions, repeat)
+    print(f"  {'any() 검사 (기존)':<30} {legacy:8.2f} µs/질문")
+    print(f"  {'IntentRouter (단일 정규식)':<30} {routed:8.2f} µs/질문  (x{legacy / routed:.1f})")
+
+    if mismatches:
+        print(f"\n❌ 의도 판정 불일치 {len(mismatches)}건")
+        for question in mismatches[:10]:
+            print(f"  {question}: {sorted(legacy_intents(question))} vs {router.route(question).intents}")
+    else:
+        print("\n✅ 모든 질문에서 의도 판정 일치")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""크롤링 경로 오프라인 벤치마크
+
+로컬 fixture 서버(campus_fixture_server)에 지연/오류를 주입해 놓고
+순차/동시 크롤링, 캐시 적중, 차단기 동작을 학교 서버 없이 측정한다.
+사용법: cd src && python bench_scraper.py [--latency 0.1] [--error-rate 0.0]
+"""
+import argparse
+import os
+import tempfile
+import time
+from datetime import date
+
+from campus_cache import TTLCache
+from campus_fixture_server import FixtureServer
+
+
+def timed(label, func):
+    started = time.perf_counter()
+    result = func()
+    print(f"  {label:<36} {(time.perf_counter() - started) * 1000:9.1f} ms")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="크롤링 경로 오프라인 벤치마크")
+    parser.add_argument("--latency", type=float, default=0.1, help="서버 응답 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--pages", type=int, default=5)
+    args = parser.parse_args()
+
+    from chatbot_model import CompleteCampusKnowledgeBase
+
+    with FixtureServer(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                       seed=args.seed) as server, tempfile.TemporaryDirectory() as tmp:
+        # 실제 캐시/저장소를 건드리지 않도록 지식 베이스를 만들기 전에 디스크 캐시 위치를 임시 폴더로
+        # (SQLite 저장소/공지 저장소/임베딩 모두 CAMPUS_CACHE_DIR 아래에 생기고, 빈 저장소로 시작)
+        previous_cache_dir = os.environ.get("CAMPUS_CACHE_DIR")
+        os.environ["CAMPUS_CACHE_DIR"] = tmp
+        try:
+            kb = CompleteCampusKnowledgeBase()
+            kb.use_base_url(server.base_url)
+
+            print(f"📊 크롤링 벤치마크 (지연 {args.latency}s, 오류율 {args.error_rate}, {server.base_url})")
+            print("=" * 60)
+
+            print("\n[공지사항]")
+            timed(f"순차 {args.pages}페이지", lambda: kb.fetch_latest_notices(args.pages, parallel=False))
+            timed(f"동시 {args.pages}페이지", lambda: kb.fetch_latest_notices(args.pages, parallel=True))
+            timed("증분 (최초)", lambda: kb.fetch_new_notices(args.pages))
+            timed("증분 (변경 없음)", lambda: kb.fetch_new_notices(args.pages))
+
+            print("\n[식단]")
+            today = date.today().strftime("%Y.%m.%d")
+            timed("get_menu (최초, 크롤링)", lambda: kb.get_menu(today))
+            timed("get_menu (캐시 적중)", lambda: kb.get_menu(today))
+            kb.cache.invalidate(TTLCache.make_key("menu", today))
+            timed("get_menu (만료 후 stale 반환)", lambda: kb.get_menu(today))
+
+            # 메모리 캐시를 비워 기본 코드는 SQLite 스냅샷, 나머지 식당 코드는 크롤링
+            codes = list(kb.cafeteria_codes)
+            for label, workers in (("순차", 1), ("동시", None)):
+                kb.cache.invalidate()
+                kb.swr.last_good.clear()
+                timed(f"fetch_menus 1일 × {len(codes)}개 식당 {label}",
+                      lambda: kb.fetch_menus(today, cafeteria_codes=codes, max_workers=workers))
+            timed(f"fetch_menus 1일 × {len(codes)}개 식당 (캐시 적중)", lambda: kb.fetch_menus(today, cafeteria_codes=codes))
+
+            print("\n[조건부 요청]")
+            timed(f"공지 동시 {args.pages}페이지 (재요청, 304)", lambda: kb.fetch_latest_notices(args.pages, parallel=True))
+            print(f"  {kb.http.transfer_stats()}")
+
+            print(f"\n서버: {server.stats()}")
+            print(f"차단기: {kb.http.stats()}")
+            kb.http.close()
+        finally:
+            # 같은 프로세스에서 이어서 만드는 지식 베이스가 삭제된 임시 폴더를 쓰지 않도록 원래 값 복원
+            if previous_cache_dir is None:
+                os.environ.pop("CAMPUS_CACHE_DIR", None)
+            else:
+                os.environ["CAMPUS_CACHE_DIR"] = previous_cache_dir
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import hashlib
+import os
+import re
+import sqlite3
+import time
+import unicodedata
+from contextlib import closing
+
+from campus_cache import TTLCache
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS answers (
+    namespace TEXT NOT NULL,
+    question TEXT NOT NULL,
+    version TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (namespace, question, version)
+);
+CREATE INDEX IF NOT EXISTS idx_answers_created_at ON answers(created_at);
+"""
+
+# 질문 끝의 문장부호/이모티콘성 문자는 같은 질문으로 봄 ("학식 뭐야?" == "학식 뭐야")
+TRAILING = re.compile(r"[\s?!.~…ㅋㅎㅠㅜ]+$")
+
+
+def normalize_question(question):
+    """전각/반각, 대소문자, 공백, 끝 문장부호 차이를 없앤 질문"""
+    text = unicodedata.normalize("NFKC", question).lower()
+    text = re.sub(r"\s+", " ", text).strip()
+    return TRAILING.sub("", text)
+
+
+def context_version(context):
+    """컨텍스트 문자열의 해시 (식단/공지 스냅샷이나 일정 D-day가 바뀌면 달라짐)"""
+    return hashlib.sha1(context.encode("utf-8")).hexdigest()[:16]
+
+
+def cache_namespace(model_name, *parts):
+    """모델 이름 + 프롬프트/생성 설정 해시 (지시문이나 프로필이 바뀌면 이전 답변을 쓰지 않음)"""
+    return f"{model_name}:{context_version(chr(0).join(str(part) for part in parts))}"
+
+
+class AnswerCache:
+    """정규화한 질문 + 컨텍스트 버전별 생성 답변 캐시
+
+    키에 답변을 만들 때 쓴 컨텍스트의 해시가 들어가므로 식단/공지 스냅샷이
+    바뀌면 자동으로 다른 키가 되어 이전 답변은 다시 나오지 않는다.
+    메모리 TTL + LRU 캐시 앞단에, path를 주면 SQLite에도 저장해 재시작/워커 간 공유한다.
+    """
+
+    def __init__(self, maxsize=256, ttl=3600, path=None, namespace=""):
+        self.ttl = ttl
+        self.namespace = namespace  # cache_namespace(모델 이름, 프롬프트, 생성 설정)
+        self.memory = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.path = path
+        if path:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            with closing(self._connect()) as conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.executescript(SCHEMA)
+                conn.commit()
+
+        # 통계
+        self.disk_hits = 0
+        self.stores = 0
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=5)
+
+    def key(self, question, context, variant=""):
+        """질문 + 컨텍스트 키
+
+        variant: 같은 컨텍스트에서도 답이 달라지는 값 (생성 설정, 프롬프트에 들어간 날짜/시각 등)
+        """
+        return (normalize_question(question), context_version(f"{variant}\0{context}"))
+
+    def get(self, key):
+        """저장된 답변 (없거나 만료됐으면 None)"""
+        answer = self.memory.get(key)
+        if answer is not None or not self.path:
+            return answer
+
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT answer, created_at FROM answers WHERE namespace = ? AND question = ? AND version = ?",
+                (self.namespace,) + key
+            ).fetchone()
+        if row is None:
+            return None
+        answer, created_at = row
+        remaining = created_at + self.ttl - time.time()
+        if remaining <= 0:
+            return None
+        self.disk_hits += 1
+        self.memory.set(key, answer, ttl=remaining)
+        return answer
+
+    def set(self, key, answer):
+        self.memory.set(key, answer)
+        self.stores += 1
+        if not self.path:
+            return
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO answers (namespace, question, version, answer, created_at) VALUES (?, ?, ?, ?, ?)",
+                (self.namespace,) + key + (answer, now)
+            )
+            # 버전이 바뀌어 더 이상 조회되지 않는 답변도 TTL이 지나면 정리
+            conn.execute("DELETE FROM answers WHERE created_at < ?", (now - self.ttl,))
+
+    def invalidate(self):
+        """전체 답변 캐시 비우기"""
+        self.memory.invalidate()
+        if self.path:
+            with closing(self._connect()) as conn, conn:
+                conn.execute("DELETE FROM answers WHERE namespace = ?", (self.namespace,))
+
+    def stats(self):
+        stats = self.memory.stats()
+        stats.update({"disk": bool(self.path), "disk_hits": self.disk_hits, "stores": self.stores})
+        return stats
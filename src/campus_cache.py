@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import os
+import threading
+import time
+from collections import OrderedDict
+
+# 디스크 캐시 기본 위치: 실행 위치와 무관하게 저장소 루트의 cache/ (CAMPUS_CACHE_DIR로 변경)
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cache")
+
+
+def cache_path(*parts):
+    """디스크 캐시 경로 (호출 시점의 CAMPUS_CACHE_DIR 반영)"""
+    return os.path.join(os.environ.get("CAMPUS_CACHE_DIR") or DEFAULT_CACHE_DIR, *parts)
+
+
+class TTLCache:
+    """TTL + LRU 캐시 (크롤링 결과를 소스/날짜별로 보관)"""
+
+    def __init__(self, maxsize=128, ttl=1800):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()  # key -> (만료시각, 값)
+        self._lock = threading.Lock()
+
+        # 통계
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(source, date_str=None):
+        """소스 + 날짜 키 생성 (예: ("menu", "2025.06.18"))"""
+        return (source, date_str)
+
+    def get(self, key, default=None):
+        """만료되지 않은 값 반환 (조회 시 LRU 순서 갱신)"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                # 만료된 항목은 즉시 제거
+                del self._data[key]
+                self.misses += 1
+                return default
+
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, ttl=None):
+        """값 저장 (용량 초과 시 가장 오래 안 쓴 항목부터 제거)"""
+        ttl = self.ttl if ttl is None else ttl
+        with self._lock:
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_load(self, key, loader, ttl=None):
+        """캐시에 없으면 loader()로 채움 (None 결과는 캐시하지 않음)"""
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        value = loader()
+        if value is not None:
+            self.set(key, value, ttl)
+        return value
+
+    def invalidate(self, key=None):
+        """특정 키 또는 전체 캐시 무효화"""
+        with self._lock:
+            if key is None:
+                self._data.clear()
+            else:
+                self._data.pop(key, None)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._data)
+
+    def __contains__(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            return entry is not None and entry[0] > time.monotonic()
+
+    def stats(self):
+        """히트/미스 통계"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": (self.hits / total) if total else 0.0
+            }
@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import calendar
+import re
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+
+from campus_dates import DateParser
+from campus_passages import Passage, label
+
+# 경로의 키 -> 일정 유형 (경로 끝에서부터 찾음, 학기 주요 날짜의 start_date는 개강)
+EVENT_KINDS = {
+    "pre_registration": "예비수강신청", "main_registration": "수강신청", "confirmation_change": "수강정정",
+    "cancellation": "수강취소", "tuition": "등록금", "grade_announcement": "성적공개",
+    "semester_dates": "개강", "last_class": "종강", "quarter_point": "수업일수", "third_point": "수업일수",
+    "half_point": "수업일수", "two_thirds_point": "수업일수", "three_quarters_point": "수업일수",
+    "midterm": "중간고사", "final": "기말고사", "summer_session": "계절학기", "winter_session": "계절학기",
+    "vacation": "방학", "leave_return": "휴복학", "early_graduation": "조기졸업", "thesis_deferral": "학위취득유예",
+    "convergence_major": "융복합전공", "curriculum_change": "교육과정변경", "entrance_ceremony": "입학식",
+    "graduation_ceremonies": "학위수여식", "founding_day": "개교기념일",
+}
+# 질문 표현 -> 일정 유형
+KIND_CUES = [
+    (re.compile(r"예비\s*수강"), ["예비수강신청"]),
+    (re.compile(r"수강\s*신청|수강신청"), ["수강신청", "예비수강신청"]),
+    (re.compile(r"정정|수강\s*변경"), ["수강정정"]),
+    (re.compile(r"수강\s*취소|수강\s*철회"), ["수강취소"]),
+    (re.compile(r"등록금"), ["등록금"]),
+    (re.compile(r"개강"), ["개강"]),
+    (re.compile(r"종강"), ["종강"]),
+    (re.compile(r"중간"), ["중간고사"]),
+    (re.compile(r"기말"), ["기말고사"]),
+    (re.compile(r"시험"), ["중간고사", "기말고사"]),
+    (re.compile(r"계절"), ["계절학기"]),
+    (re.compile(r"방학"), ["방학"]),
+    (re.compile(r"성적"), ["성적공개"]),
+    (re.compile(r"휴학|복학"), ["휴복학"]),
+    (re.compile(r"조기\s*졸업"), ["조기졸업"]),
+    (re.compile(r"졸업식|학위\s*수여"), ["학위수여식"]),
+    (re.compile(r"입학식"), ["입학식"]),
+    (re.compile(r"개교"), ["개교기념일"]),
+]
+# 날짜가 들어 있어도 일정으로 보지 않는 키
+SKIP_KEYS = {"deadline", "classes_start", "description", "notes", "note", "requirements", "contact",
+             "contact_info", "important_notes", "helpful_tips", "online_systems", "overview"}
+# 경로 제목에서 생략하는 키 (유형이 아닌 자리 표시)
+GENERIC_KEYS = {"period", "periods", "date", "payment_period", "registration", "semester_dates", "exam_periods",
+                "special_applications", "ceremonies_events"}
+
+WEEKDAY_MARK = re.compile(r"\([월화수목금토일]\)")
+# "4월 중순"처럼 대략적인 날짜 (초순 1~10일, 중순 11~20일, 하순 21~말일)
+APPROX_PATTERN = re.compile(r"(?:(\d{4})년\s*)?(\d{1,2})월\s*(초|중|하)순")
+# "12월 학사일정"처럼 일 없이 월만 있는 질문 (DateParser는 월만으로는 날짜를 만들지 않음)
+MONTH_PATTERN = re.compile(r"(?:(\d{4})년\s*)?(?<!\d)(\d{1,2})월(?!\s*\d)")
+
+
+class CalendarEvent:
+    """학사일정 한 항목 (start~end, 양 끝 포함)"""
+
+    __slots__ = ("start", "end", "kind", "title", "path", "approximate")
+
+    def __init__(self, start, end, kind, title, path, approximate=False):
+        self.start = start
+        self.end = end
+        self.kind = kind
+        self.title = title
+        self.path = path
+        self.approximate = approximate
+
+    def status(self, today):
+        if today < self.start:
+            return f"D-{(self.start - today).days}"
+        if today > self.end:
+            return "종료"
+        return "진행 중"
+
+    def render(self, today):
+        period = f"{self.start:%Y-%m-%d}" if self.start == self.end else f"{self.start:%Y-%m-%d} ~ {self.end:%Y-%m-%d}"
+        approx = " (대략, 정확한 날짜는 학과 공지 확인)" if self.approximate else ""
+        return f"{period}{approx} [{self.status(today)}]"
+
+    def passage(self, today):
+        """컨텍스트용 passage (오늘 기준 진행 상태 포함)"""
+        return Passage(self.path, self.title, self.render(today))
+
+    def __repr__(self):
+        return f"CalendarEvent({self.kind}, {self.start}~{self.end}, {self.title!r})"
+
+
+def event_kind(keys):
+    for key in reversed(keys):
+        if key in EVENT_KINDS:
+            return EVENT_KINDS[key]
+    if keys[-1] == "period" and len(keys) == 2:
+        return "학기"
+    return "기타"
+
+
+def parse_period(text, parser, reference):
+    """일정 문자열 -> (시작, 끝, 대략 여부) 또는 None"""
+    text = WEEKDAY_MARK.sub("", text)
+    found = parser.parse_all(text, reference)
+    if found:
+        # 물결표가 있을 때만 첫 날짜~마지막 날짜를 기간으로 ("3월 28일 (수업일수 1/4선)"은 하루)
+        start, end = found[0].start, (found[-1] if "~" in text else found[0]).end
+        if end < start:  # "12월 22일 ~ 1월 13일"처럼 해를 넘기는 기간
+            end = end.replace(year=end.year + 1)
+        return start, end, False
+
+    match = APPROX_PATTERN.search(text)
+    if match:
+        year = int(match.group(1) or reference.year)
+        month = int(match.group(2))
+        first, last = {"초": (1, 10), "중": (11, 20), "하": (21, calendar.monthrange(year, month)[1])}[match.group(3)]
+        return date(year, month, first), date(year, month, last), True
+    return None
+
+
+def extract_events(academic_schedule, year=None):
+    """academic_schedule dict를 걸으며 날짜가 있는 값을 CalendarEvent로 변환"""
+    if year is None:
+        found = re.search(r"\d{4}", academic_schedule.get("overview", {}).get("academic_year", ""))
+        year = int(found.group()) if found else date.today().year
+    reference = date(year, 3, 1)
+    parser = DateParser()
+    events = []
+
+    def walk(node, keys, prefix):
+        if isinstance(node, dict):
+            # 학기 이름("2025학년도 제1학기")은 하위 일정 제목 앞에 붙임
+            prefix = node.get("name", prefix) if keys and keys[-1].endswith("_semester") else prefix
+            for key, value in node.items():
+                if key not in SKIP_KEYS and key != "name":
+                    walk(value, keys + [key], prefix)
+            return
+        if isinstance(node, list):
+            for item in node:
+                walk(item, keys, prefix)
+            return
+        if not isinstance(node, str):
+            return
+
+        period = parse_period(node, parser, reference)
+        if period is None:
+            return
+        start, end, approximate = period
+        names = [label(key) for key in keys if key not in GENERIC_KEYS]
+        if prefix:
+            names = [prefix] + [name for name in names if name not in ("1학기", "2학기")]
+        if keys[-1] == "registration":
+            names.append("신청")
+        if "취소" in node:
+            names.append("취소")
+        events.append(CalendarEvent(start, end, event_kind(keys), " ".join(names),
+                                    "academic_schedule." + ".".join(keys), approximate))
+
+    walk(academic_schedule, [], None)
+    return events
+
+
+class CalendarIndex:
+    """학사일정 구간 색인
+
+    모든 시작일/종료일+1을 경계로 날짜축을 구간으로 나누고 구간마다 진행 중인
+    일정 목록을 미리 만들어 둔다. 날짜 조회는 경계 배열 bisect 한 번,
+    유형별 다음 일정은 유형별 시작일 배열 bisect 한 번으로 찾는다.
+    """
+
+    def __init__(self, events):
+        self.events = sorted(events, key=lambda event: (event.start, event.end))
+
+        self.bounds = sorted({event.start for event in self.events}
+                             | {event.end + timedelta(days=1) for event in self.events})
+        self.active = [[] for _ in self.bounds]
+        for event in self.events:
+            first = bisect_left(self.bounds, event.start)
+            last = bisect_left(self.bounds, event.end + timedelta(days=1))
+            for i in range(first, last):
+                self.active[i].append(event)
+
+        self.by_kind = {}
+        for event in self.events:
+            self.by_kind.setdefault(event.kind, []).append(event)
+        self.kind_starts = {kind: [event.start for event in events] for kind, events in self.by_kind.items()}
+        self.starts = [event.start for event in self.events]
+
+    def on(self, day):
+        """day에 진행 중인 일정"""
+        i = bisect_right(self.bounds, day) - 1
+        return list(self.active[i]) if i >= 0 else []
+
+    def between(self, start, end):
+        """start~end와 겹치는 일정 (시작일 순)"""
+        first = max(bisect_right(self.bounds, start) - 1, 0)
+        last = bisect_right(self.bounds, end)
+        seen, result = set(), []
+        for i in range(first, last):
+            for event in self.active[i]:
+                if id(event) not in seen:
+                    seen.add(id(event))
+                    result.append(event)
+        result.sort(key=lambda event: (event.start, event.end))
+        return result
+
+    def next_event(self, kind, after):
+        """after 이후(진행 중 포함) 가장 가까운 kind 일정 (없으면 None)"""
+        events = self.by_kind.get(kind, [])
+        i = bisect_left(self.kind_starts.get(kind, []), after)
+        # 이미 시작했지만 아직 끝나지 않은 일정이 바로 앞에 있을 수 있음
+        if i > 0 and events[i - 1].end >= after:
+            return events[i - 1]
+        return events[i] if i < len(events) else None
+
+    def month_range(self, question, today):
+        """질문의 "N월" -> (그 달 1일, 말일) 또는 None (연도가 없으면 올해)"""
+        match = MONTH_PATTERN.search(question)
+        if not match or not 1 <= int(match.group(2)) <= 12:
+            return None
+        year, month = int(match.group(1) or today.year), int(match.group(2))
+        return date(year, month, 1), date(year, month, calendar.monthrange(year, month)[1])
+
+    def next_events(self, kinds, after):
+        """유형별 after 이후 가장 가까운 일정 (올해 일정이 모두 끝났으면 마지막 일정)"""
+        events = []
+        for kind in kinds:
+            event = self.next_event(kind, after)
+            if event is None and self.by_kind.get(kind):
+                event = self.by_kind[kind][-1]
+            if event is not None and event not in events:
+                events.append(event)
+        return events
+
+    def relevant(self, question, when=None, today=None, upcoming=3):
+        """질문과 관련된 일정
+
+        날짜/월이 있으면 그 기간의 일정 (유형도 있으면 그 유형만, 기간 안에 없으면
+        그 날짜 이후 다음 일정), 일정 유형만 있으면 그 유형의 다음 일정,
+        둘 다 없으면 오늘 진행 중인 일정 + 다가오는 일정
+        """
+        today = today or date.today()
+        kinds = [kind for pattern, kinds in KIND_CUES if pattern.search(question) for kind in kinds]
+        kinds = list(dict.fromkeys(kinds))
+
+        period = (when.start, when.end) if when is not None else self.month_range(question, today)
+        if period is not None:
+            events = self.between(*period)
+            if not kinds:
+                return events
+            # "지금 수강신청 기간이야?" -> 오늘 수강신청이 없으면 다음 수강신청 일정
+            return [event for event in events if event.kind in kinds] or self.next_events(kinds, period[0]) or events
+
+        if kinds:
+            return self.next_events(kinds, today)
+
+        events = self.on(today)
+        i = bisect_right(self.starts, today)
+        return events + self.events[i:i + upcoming]
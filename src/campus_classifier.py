@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""질문 유형 분류기 (classifier.ipynb의 QClassifier)
+
+학습: cd src && python campus_classifier.py train --output ../checkpoints/qclassifier
+사용: QuestionClassifier.load(경로).predict(["오늘 학식 뭐야?"]) -> [[p0, ..., p4]]
+"""
+import argparse
+import json
+import os
+
+import torch
+import torch.nn as nn
+from transformers import AutoConfig, AutoModel, AutoTokenizer
+
+from campus_router import LABELS
+
+DEFAULT_MODEL = "klue/roberta-large"
+TRAIN_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "train.json")
+
+# 실시간 크롤링을 일으키는 유형
+SCRAPE_TOPICS = {"notice", "dining"}
+
+
+def hybrid_topics(route, probs=None, threshold=0.8):
+    """키워드 라우팅 + 분류기 확률로 이번 질문의 주제 결정
+
+    분류기가 threshold 이상으로 확신하면 예측 유형만 크롤링하고,
+    크롤링이 없는 키워드 주제(정적 정보)는 그대로 둔다.
+    확신하지 못하거나 분류기가 없으면 키워드 결과를 그대로 사용한다.
+    """
+    keyword_topics = {label for label in LABELS if route.has(label)}
+    if probs is None:
+        return keyword_topics
+
+    best = max(range(len(probs)), key=probs.__getitem__)
+    if probs[best] < threshold:
+        return keyword_topics
+    return {LABELS[best]} | (keyword_topics - SCRAPE_TOPICS)
+
+
+class QClassifier(nn.Module):
+    """RoBERTa pooler 출력 + 선형 분류층"""
+
+    def __init__(self, model_name=DEFAULT_MODEL, num_classes=len(LABELS), pretrained=True):
+        super(QClassifier, self).__init__()
+        if pretrained:
+            self.basemodel = AutoModel.from_pretrained(model_name)
+        else:
+            # 체크포인트 로드 시에는 구조만 만들고 가중치는 state_dict로 채움
+            self.basemodel = AutoModel.from_config(AutoConfig.from_pretrained(model_name))
+        self.classifier = nn.Linear(self.basemodel.config.hidden_size, num_classes)
+
+    def forward(self, input_ids, attention_mask, token_type_ids=None):
+        outputs = self.basemodel(input_ids=input_ids, attention_mask=attention_mask, token_type_ids=token_type_ids)
+        pooled_output = outputs.pooler_output
+        return self.classifier(pooled_output)
+
+
+class QuestionClassifier:
+    """QClassifier 추론 래퍼 (체크포인트 저장/로드 + 배치 예측)"""
+
+    CONFIG_FILE = "classifier_config.json"
+    WEIGHTS_FILE = "classifier.pt"
+
+    def __init__(self, model, tokenizer, model_name=DEFAULT_MODEL, max_len=64, device=None):
+        self.device = torch.device(device or ("cuda" if torch.cuda.is_available() else "cpu"))
+        self.model = model.to(self.device).eval()
+        self.tokenizer = tokenizer
+        self.model_name = model_name
+        self.max_len = max_len
+
+    @classmethod
+    def from_pretrained(cls, model_name=DEFAULT_MODEL, max_len=64, device=None):
+        """학습 전 초기 모델"""
+        return cls(QClassifier(model_name), AutoTokenizer.from_pretrained(model_name), model_name, max_len, device)
+
+    def save(self, path):
+        os.makedirs(path, exist_ok=True)
+        torch.save(self.model.state_dict(), os.path.join(path, self.WEIGHTS_FILE))
+        self.tokenizer.save_pretrained(path)
+        with open(os.path.join(path, self.CONFIG_FILE), "w", encoding="utf-8") as f:
+            json.dump({"model_name": self.model_name, "labels": LABELS, "max_len": self.max_len},
+                      f, ensure_ascii=False, indent=2)
+
+    @classmethod
+    def load(cls, path, device=None):
+        with open(os.path.join(path, cls.CONFIG_FILE), "r", encoding="utf-8") as f:
+            config = json.load(f)
+        if config.get("labels", LABELS) != LABELS:
+            raise ValueError(f"레이블 순서가 다른 체크포인트입니다: {config['labels']}")
+
+        model = QClassifier(config["model_name"], pretrained=False)
+        state = torch.load(os.path.join(path, cls.WEIGHTS_FILE), map_location="cpu")
+        model.load_state_dict(state)
+        tokenizer = AutoTokenizer.from_pretrained(path)
+        return cls(model, tokenizer, config["model_name"], config.get("max_len", 64), device)
+
+    def encode(self, questions):
+        return self.tokenizer(questions, padding=True, truncation=True, max_length=self.max_len,
+                              return_tensors="pt").to(self.device)
+
+    def predict(self, questions, batch_size=32):
+        """질문 목록 -> 유형별 확률 [[p0, ..., p4], ...] (LABELS 순서)"""
+        probs = []
+        with torch.no_grad():
+            for start in range(0, len(questions), batch_size):
+                logits = self.model(**self.encode(questions[start:start + batch_size]))
+                probs.extend(torch.softmax(logits.float(), dim=-1).cpu().tolist())
+        return probs
+
+    def predict_labels(self, questions, batch_size=32):
+        """질문 목록 -> 예측 유형 번호"""
+        return [max(range(len(p)), key=p.__getitem__) for p in self.predict(questions, batch_size)]
+
+
+def load_split(path=TRAIN_FILE, test_size=0.2, seed=42):
+    """노트북과 같은 방식의 80/20 층화 분할 (train, val)"""
+    from sklearn.model_selection import train_test_split
+
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return train_test_split(data, test_size=test_size, stratify=[x["label"] for x in data], random_state=seed)
+
+
+def train(output, model_name=DEFAULT_MODEL, epochs=6, batch_size=16, lr=2e-5, max_len=64):
+    """train.json으로 QClassifier 학습 후 체크포인트 저장"""
+    from sklearn.metrics import f1_score
+    from tqdm import tqdm
+
+    train_data, val_data = load_split()
+    classifier = QuestionClassifier.from_pretrained(model_name, max_len)
+    model = classifier.model
+    optimizer = torch.optim.AdamW(model.parameters(), lr=lr)
+    criterion = nn.CrossEntropyLoss()
+
+    for epoch in range(epochs):
+        model.train()
+        order = torch.randperm(len(train_data)).tolist()
+        total_loss = 0
+        for start in tqdm(range(0, len(order), batch_size), desc=f"[Epoch {epoch + 1}] Training"):
+            batch = [train_data[i] for i in order[start:start + batch_size]]
+            inputs = classifier.encode([x["question"] for x in batch])
+            labels = torch.tensor([x["label"] for x in batch], device=classifier.device)
+
+            optimizer.zero_grad()
+            loss = criterion(model(**inputs), labels)
+            loss.backward()
+            optimizer.step()
+            total_loss += loss.item()
+
+        model.eval()
+        preds = classifier.predict_labels([x["question"] for x in val_data])
+        f1 = f1_score([x["label"] for x in val_data], preds, average="macro")
+        print(f"[Epoch {epoch + 1}] Train Loss: {total_loss:.4f}, Val F1: {f1:.4f}")
+
+    classifier.save(output)
+    print(f"💾 체크포인트 저장: {output}")
+    return classifier
+
+
+def main():
+    parser = argparse.ArgumentParser(description="질문 유형 분류기")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    train_parser = sub.add_parser("train", help="train.json으로 학습")
+    train_parser.add_argument("--output", required=True)
+    train_parser.add_argument("--model-name", default=DEFAULT_MODEL)
+    train_parser.add_argument("--epochs", type=int, default=6)
+    train_parser.add_argument("--batch-size", type=int, default=16)
+    train_parser.add_argument("--lr", type=float, default=2e-5)
+
+    predict_parser = sub.add_parser("predict", help="질문 분류")
+    predict_parser.add_argument("--checkpoint", required=True)
+    predict_parser.add_argument("questions", nargs="+")
+
+    args = parser.parse_args()
+    if args.command == "train":
+        train(args.output, args.model_name, args.epochs, args.batch_size, args.lr)
+        return
+
+    classifier = QuestionClassifier.load(args.checkpoint)
+    for question, probs in zip(args.questions, classifier.predict(args.questions)):
+        best = max(range(len(probs)), key=probs.__getitem__)
+        print(f"{question} -> {LABELS[best]} ({probs[best]:.2f})")
+
+
+if __name__ == "__main__":
+    main()
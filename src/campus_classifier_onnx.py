@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""질문 분류기 CPU 추론 경로 (ONNX 변환 + int8 동적 양자화)
+
+변환: cd src && python campus_classifier_onnx.py export --checkpoint ../checkpoints/qclassifier --output ../checkpoints/qclassifier_onnx
+비교: cd src && python campus_classifier_onnx.py bench --checkpoint ../checkpoints/qclassifier --onnx ../checkpoints/qclassifier_onnx
+"""
+import argparse
+import json
+import os
+import shutil
+import time
+
+# ONNX 추론에만 필요 (경량 모델 경로는 numpy/torch 없이 동작)
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# campus_classifier(QuestionClassifier)는 torch/transformers를 불러오므로 PyTorch 경로에서만 import
+from campus_router import LABELS
+
+FP32_FILE = "model.onnx"
+INT8_FILE = "model.int8.onnx"
+CONFIG_FILE = "classifier_config.json"  # QuestionClassifier.CONFIG_FILE과 같은 파일
+
+
+def export_onnx(checkpoint, output, opset=17):
+    """체크포인트 -> ONNX(fp32) + int8 동적 양자화 모델"""
+    import torch
+    try:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+    except ImportError:
+        raise ImportError("onnxruntime이 필요합니다: pip install onnx onnxruntime")
+    from campus_classifier import QuestionClassifier
+
+    classifier = QuestionClassifier.load(checkpoint, device="cpu")
+    os.makedirs(output, exist_ok=True)
+
+    sample = classifier.encode(["오늘 학식 메뉴 알려줘", "셔틀버스 막차 몇 시야?"])
+    input_names = [name for name in ("input_ids", "attention_mask", "token_type_ids") if name in sample]
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+    dynamic_axes["logits"] = {0: "batch"}
+
+    fp32_path = os.path.join(output, FP32_FILE)
+    torch.onnx.export(
+        classifier.model,
+        tuple(sample[name] for name in input_names),
+        fp32_path,
+        input_names=input_names,
+        output_names=["logits"],
+        dynamic_axes=dynamic_axes,
+        opset_version=opset
+    )
+    quantize_dynamic(fp32_path, os.path.join(output, INT8_FILE), weight_type=QuantType.QInt8)
+
+    # 토크나이저/설정은 그대로 복사 (ONNX 폴더만으로 로드 가능하도록)
+    classifier.tokenizer.save_pretrained(output)
+    shutil.copy(os.path.join(checkpoint, CONFIG_FILE), os.path.join(output, CONFIG_FILE))
+
+    for name in (FP32_FILE, INT8_FILE):
+        size = os.path.getsize(os.path.join(output, name)) / 1024 / 1024
+        print(f"💾 {name} 저장 ({size:.1f} MB)")
+
+
+class OnnxQuestionClassifier:
+    """ONNX Runtime 분류기 (QuestionClassifier와 같은 predict API)
+
+    질문을 토큰 길이 순으로 정렬해 길이 구간(bucket)별로 묶고,
+    구간 경계까지만 패딩해 micro-batch로 실행한다.
+    """
+
+    def __init__(self, session, tokenizer, max_len=64, buckets=(16, 32, 64), max_batch=32):
+        self.session = session
+        self.tokenizer = tokenizer
+        self.max_len = max_len
+        self.buckets = sorted(b for b in buckets if b < max_len) + [max_len]
+        self.max_batch = max_batch
+        self.input_names = [item.name for item in session.get_inputs()]
+
+    @classmethod
+    def load(cls, path, quantized=True, threads=None, **kwargs):
+        try:
+            import onnxruntime as ort
+        except ImportError:
+            raise ImportError("onnxruntime이 필요합니다: pip install onnxruntime")
+        from transformers import AutoTokenizer
+
+        with open(os.path.join(path, CONFIG_FILE), "r", encoding="utf-8") as f:
+            config = json.load(f)
+        if config.get("labels", LABELS) != LABELS:
+            raise ValueError(f"레이블 순서가 다른 체크포인트입니다: {config['labels']}")
+
+        options = ort.SessionOptions()
+        if threads:
+            options.intra_op_num_threads = threads
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        model_path = os.path.join(path, INT8_FILE if quantized else FP32_FILE)
+        session = ort.InferenceSession(model_path, options, providers=["CPUExecutionProvider"])
+        return cls(session, AutoTokenizer.from_pretrained(path), config.get("max_len", 64), **kwargs)
+
+    def bucket_for(self, length):
+        for bucket in self.buckets:
+            if length <= bucket:
+                return bucket
+        return self.max_len
+
+    def micro_batches(self, questions):
+        """[(원래 위치 목록, 패딩 길이), ...]"""
+        encoded = self.tokenizer(questions, truncation=True, max_length=self.max_len)["input_ids"]
+        order = sorted(range(len(questions)), key=lambda i: len(encoded[i]))
+
+        batches, current, current_bucket = [], [], None
+        for i in order:
+            bucket = self.bucket_for(len(encoded[i]))
+            if current and (bucket != current_bucket or len(current) >= self.max_batch):
+                batches.append((current, current_bucket))
+                current = []
+            current.append(i)
+            current_bucket = bucket
+        if current:
+            batches.append((current, current_bucket))
+        return batches
+
+    def predict(self, questions, batch_size=None):
+        """질문 목록 -> 유형별 확률 [[p0, ..., p4], ...] (입력 순서 유지)"""
+        if not questions:
+            return []
+        probs = [None] * len(questions)
+        for indices, length in self.micro_batches(questions):
+            inputs = self.tokenizer([questions[i] for i in indices], padding="max_length", truncation=True,
+                                    max_length=length, return_tensors="np")
+            feed = {name: inputs[name].astype(np.int64) for name in self.input_names}
+            logits = self.session.run(["logits"], feed)[0]
+            logits = logits - logits.max(axis=1, keepdims=True)
+            exp = np.exp(logits)
+            batch_probs = exp / exp.sum(axis=1, keepdims=True)
+            for i, row in zip(indices, batch_probs.tolist()):
+                probs[i] = row
+        return probs
+
+    def predict_labels(self, questions):
+        return [max(range(len(p)), key=p.__getitem__) for p in self.predict(questions)]
+
+
+def load_runtime_classifier(path, device=None):
+    """경로에 따라 경량 모델(.json.gz), ONNX(int8 우선) 또는 PyTorch 분류기 로드"""
+    if path.endswith(".json.gz"):
+        from campus_tiny_classifier import TinyClassifier
+        return TinyClassifier.load(path)
+    if os.path.exists(os.path.join(path, INT8_FILE)):
+        return OnnxQuestionClassifier.load(path, quantized=True)
+    if os.path.exists(os.path.join(path, FP32_FILE)):
+        return OnnxQuestionClassifier.load(path, quantized=False)
+    from campus_classifier import QuestionClassifier
+    return QuestionClassifier.load(path, device=device)
+
+
+def bench(checkpoint, onnx_dir, repeat=3):
+    """검증 분할에서 fp32 PyTorch / ONNX fp32 / ONNX int8 정확도·지연 비교"""
+    from campus_classifier import QuestionClassifier, load_split
+
+    _, val_data = load_split()
+    questions = [x["question"] for x in val_data]
+    labels = [x["label"] for x in val_data]
+
+    runners = [("PyTorch fp32", QuestionClassifier.load(checkpoint, device="cpu"))]
+    runners.append(("ONNX fp32", OnnxQuestionClassifier.load(onnx_dir, quantized=False)))
+    runners.append(("ONNX int8", OnnxQuestionClassifier.load(onnx_dir, quantized=True)))
+
+    print(f"📊 분류기 CPU 추론 비교 (검증 {len(questions)}문항)")
+    print("=" * 78)
+    print(f"  {'모델':<14} {'정확도':>8} {'fp32 일치':>10} {'p50 ms':>9} {'p95 ms':>9} {'처리량 q/s':>12}")
+
+    reference = None
+    for name, runner in runners:
+        preds = runner.predict_labels(questions)
+        reference = reference or preds
+        accuracy = sum(p == y for p, y in zip(preds, labels)) / len(labels)
+        agreement = sum(p == r for p, r in zip(preds, reference)) / len(labels)
+
+        # 단건 지연 (요청 경로) + 전체 배치 처리량
+        latencies = []
+        for question in questions:
+            started = time.perf_counter()
+            runner.predict([question])
+            latencies.append((time.perf_counter() - started) * 1000)
+        latencies.sort()
+        started = time.perf_counter()
+        for _ in range(repeat):
+            runner.predict(questions)
+        throughput = len(questions) * repeat / (time.perf_counter() - started)
+
+        p50 = latencies[len(latencies) // 2]
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+        print(f"  {name:<14} {accuracy:>8.2%} {agreement:>10.2%} {p50:>9.2f} {p95:>9.2f} {throughput:>12.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="질문 분류기 ONNX 변환/비교")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    export_parser = sub.add_parser("export", help="ONNX + int8 모델 생성")
+    export_parser.add_argument("--checkpoint", required=True)
+    export_parser.add_argument("--output", required=True)
+    export_parser.add_argument("--opset", type=int, default=17)
+
+    bench_parser = sub.add_parser("bench", help="정확도/지연 비교")
+    bench_parser.add_argument("--checkpoint", required=True)
+    bench_parser.add_argument("--onnx", required=True)
+    bench_parser.add_argument("--repeat", type=int, default=3)
+
+    args = parser.parse_args()
+    if args.command == "export":
+        export_onnx(args.checkpoint, args.output, args.opset)
+    else:
+        bench(args.checkpoint, args.onnx, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from datetime import datetime
+
+from campus_cache import TTLCache
+from campus_passages import format_value
+
+WEEKDAY_NAMES = "월화수목금토일"
+
+
+def meal_text(meal):
+    """식단 한 칸 -> "중식(학생) 돈까스, 잡곡밥 (4,000원)" """
+    items = [item for item in meal["menu"] if not item.endswith("원")]
+    prices = [item for item in meal["menu"] if item.endswith("원")]
+    price = f" ({prices[0]})" if prices else ""
+    return f"{meal['meal_type']}({meal['target']}) {', '.join(items)}{price}"
+
+
+def menu_lines(menu):
+    """식단 결과(get_menu 하루치 또는 fetch_menus 기간) -> 날짜·식당별 한 줄씩
+
+    줄 순서는 날짜순, 하루 안에서는 식단표의 식당 순서
+    """
+    lines = []
+    for day in menu.get("days", [menu]):
+        if day.get("status") != "success" or not day.get("meals"):
+            lines.append(f"{day.get('date', '')}: {day.get('message', '식단 정보 없음')}\n")
+            continue
+        weekday = day.get("weekday") or WEEKDAY_NAMES[datetime.strptime(day["date"], "%Y-%m-%d").weekday()]
+        by_cafeteria = {}
+        for meal in day["meals"]:
+            by_cafeteria.setdefault(meal["cafeteria"], []).append(meal_text(meal))
+        for cafeteria, meals in by_cafeteria.items():
+            lines.append(f"{day['date']}({weekday}) {cafeteria}: {' / '.join(meals)}\n")
+    return lines
+
+
+def notice_lines(notices):
+    """공지 목록(최신순) -> 공지마다 한 줄 (몇 개를 넣을지는 ContextPacker가 토큰 예산으로 결정)"""
+    lines = []
+    for i, notice in enumerate(notices, 1):
+        if "message" in notice:  # 불러오는 중/오류 안내
+            lines.append(f"{notice.get('title', '')} {notice['message']}\n")
+            continue
+        meta = ", ".join(value for value in (notice.get("date"), notice.get("writer")) if value)
+        lines.append(f"{i}. {notice.get('title', 'N/A')}" + (f" ({meta})" if meta else "") + "\n")
+    return lines
+
+
+def dict_lines(data):
+    """그 밖의 실시간 dict -> 항목마다 온전한 한 줄"""
+    return [f"• {key}: {format_value(value)}\n" for key, value in data.items()]
+
+
+class ContextBlock:
+    """컨텍스트의 한 섹션 (【제목】 + 관련도 순으로 정렬된 줄들)"""
+
+    __slots__ = ("title", "lines")
+
+    def __init__(self, title, lines):
+        self.title = title
+        self.lines = lines
+
+    def __repr__(self):
+        return f"ContextBlock({self.title!r}, {len(self.lines)}줄)"
+
+
+class ContextPacker:
+    """토크나이저 토큰 수 기준으로 컨텍스트를 예산 안에 채움
+
+    줄마다 토큰 id를 한 번만 구해 캐시하고, 각 섹션의 1순위 줄부터
+    라운드로빈으로 넣어 한 섹션이 예산을 독차지하지 않게 한다.
+    예산을 넘는 줄은 건너뛰므로 문장이 중간에서 잘리지 않는다.
+    줄(lines)은 끝에 줄바꿈이 붙은 완성된 조각이어야 한다.
+
+    pack_ids()는 캐시한 조각별 토큰 id를 그대로 이어 붙여 컨텍스트 토큰 id도 돌려준다.
+    조각 경계에서는 전체 문자열을 한 번에 토큰화한 결과와 분할이 조금 다를 수 있지만
+    디코딩하면 같은 텍스트이고, 토큰 수는 예산 계산과 정확히 일치한다.
+    """
+
+    def __init__(self, tokenizer, budget=1024, cache_size=4096):
+        self.tokenizer = tokenizer
+        self.budget = budget
+        self.static_ids = {}  # warm()으로 미리 계산한 정적 조각 (제거하지 않음)
+        self.token_ids = TTLCache(maxsize=cache_size, ttl=float("inf"))
+
+        # 통계
+        self.packed = 0
+        self.dropped_lines = 0
+
+    def encode(self, text):
+        return self.tokenizer.encode(text, add_special_tokens=False)
+
+    def warm(self, texts):
+        """정적 조각의 토큰 id를 미리 계산 (요청 경로에서는 조회만)"""
+        for text in texts:
+            if text not in self.static_ids:
+                self.static_ids[text] = self.encode(text)
+        return len(self.static_ids)
+
+    def ids(self, text):
+        """텍스트의 토큰 id (특수 토큰 제외, 캐시)"""
+        ids = self.static_ids.get(text)
+        if ids is None:
+            ids = self.token_ids.get_or_load(text, lambda: self.encode(text))
+        return ids
+
+    def count(self, text):
+        return len(self.ids(text))
+
+    def pack(self, header, blocks, budget=None):
+        """header + 예산 안에 들어가는 줄들로 컨텍스트 문자열 생성
+
+        blocks: [ContextBlock, ...] (섹션 순서 = 출력 순서, 줄 순서 = 관련도 순서)
+        """
+        return self.pack_ids(header, blocks, budget)[0]
+
+    def pack_ids(self, header, blocks, budget=None):
+        """pack()과 같은 컨텍스트 문자열 + 캐시한 조각 토큰 id를 이어 붙인 토큰 id"""
+        budget = self.budget if budget is None else budget
+        used = self.count(header)
+        chosen = [[] for _ in blocks]
+
+        depth = max((len(block.lines) for block in blocks), default=0)
+        for rank in range(depth):
+            for i, block in enumerate(blocks):
+                if rank >= len(block.lines):
+                    continue
+                line = block.lines[rank]
+                cost = self.count(line)
+                if not chosen[i]:
+                    # 섹션의 첫 줄이 들어갈 때 제목도 함께 계산
+                    cost += self.count(f"【{block.title}】\n") + self.count("\n")
+                if used + cost > budget:
+                    self.dropped_lines += 1
+                    continue
+                used += cost
+                chosen[i].append(line)
+
+        self.packed += 1
+        parts = [header]
+        ids = list(self.ids(header))
+        for block, lines in zip(blocks, chosen):
+            if not lines:
+                continue
+            title = f"【{block.title}】\n"
+            parts.append(title + "".join(lines) + "\n")
+            ids += self.ids(title)
+            for line in lines:
+                ids += self.ids(line)
+            ids += self.ids("\n")
+        return "".join(parts), ids
+
+    def stats(self):
+        return {
+            "packed": self.packed,
+            "dropped_lines": self.dropped_lines,
+            "static_fragments": len(self.static_ids),
+            "token_cache_hits": self.token_ids.hits,
+            "token_cache_misses": self.token_ids.misses,
+        }
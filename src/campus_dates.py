@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import re
+from datetime import date, timedelta
+
+# 상대 날짜 (긴 표현부터 매칭되도록 정규식에서 길이순 정렬)
+RELATIVE_DAYS = {
+    "그저께": -2, "그제": -2,
+    "어제": -1, "yesterday": -1,
+    "오늘": 0, "today": 0, "지금": 0,
+    "내일모레": 2, "내일": 1, "tomorrow": 1,
+    "모레": 2, "글피": 3,
+}
+WEEK_OFFSETS = {"지난": -1, "저번": -1, "이번": 0, "다음": 1, "담": 1}
+WEEKDAY_CHARS = "월화수목금토일"
+
+# 월.일 뒤에 오면 날짜가 아닌 숫자로 보는 단위 (3.5학점, 1-2학년, 1/4선 등)
+NUMBER_UNITS = ["학점", "학년", "학기", "점", "시간", "시", "배", "%", "퍼센트", "개", "명", "원",
+                "분", "초", "년", "층", "주", "선", "만점", "이상", "이하", "미만", "초과"]
+
+# 두 날짜 사이에 오면 기간으로 합치는 연결어 (6월 16일부터 20일까지, 6/16~6/20)
+RANGE_JOINER = re.compile(r"\s*(?:~|-|–|부터|에서)\s*")
+
+
+def _alternation(words):
+    return "|".join(re.escape(word) for word in sorted(words, key=len, reverse=True))
+
+
+WEEK_WORDS = _alternation(WEEK_OFFSETS)
+DATE_PATTERN = re.compile(
+    r"(?P<ymd>(?<![\d.])(?P<y>\d{4})\s*[.\-/년]\s*(?P<y_m>\d{1,2})\s*[.\-/월]\s*(?P<y_d>\d{1,2})(?:\s*일)?(?![\d.]))"
+    r"|(?P<md>(?P<k_m>\d{1,2})\s*월\s*(?P<k_d>\d{1,2})\s*일)"
+    rf"|(?P<numeric>(?<![\d.])(?P<n_m>\d{{1,2}})[.\-/](?P<n_d>\d{{1,2}})(?![\d.]|\s*(?:{_alternation(NUMBER_UNITS)})))"
+    r"|(?P<offset>(?P<o_n>\d{1,3})\s*일\s*(?P<o_dir>후|뒤|전))"
+    rf"|(?P<weekday>(?:(?P<wd_week>{WEEK_WORDS})\s*주\s*)?(?P<wd>[{WEEKDAY_CHARS}])요일)"
+    rf"|(?P<week>(?P<w_week>{WEEK_WORDS})\s*주(?P<w_end>\s*말)?)"
+    r"|(?P<weekend>주말)"
+    rf"|(?P<relative>{_alternation(RELATIVE_DAYS)})"
+    r"|(?P<day>(?<![\d월])(?P<d_d>\d{1,2})\s*일(?!\s*(?:후|뒤|전|간|동안|차|째)))",
+    re.IGNORECASE
+)
+# 모든 날짜 표현에 반드시 들어가는 조각 (대부분의 질문은 이 검사만으로 끝남)
+DATE_TRIGGER = re.compile(rf"\d|요일|주|{_alternation(RELATIVE_DAYS)}", re.IGNORECASE)
+
+
+class DateMatch:
+    """질문에서 찾은 날짜 또는 기간 (start == end면 하루)"""
+
+    __slots__ = ("start", "end", "span", "kind")
+
+    def __init__(self, start, end, span, kind):
+        self.start = start
+        self.end = end
+        self.span = span
+        self.kind = kind
+
+    @property
+    def is_range(self):
+        return self.start != self.end
+
+    def days(self):
+        return [self.start + timedelta(days=i) for i in range((self.end - self.start).days + 1)]
+
+    def __repr__(self):
+        if self.is_range:
+            return f"DateMatch({self.kind}, {self.start}~{self.end}, {self.span})"
+        return f"DateMatch({self.kind}, {self.start}, {self.span})"
+
+
+def week_range(today, offset=0):
+    """today가 속한 주(월~일)에서 offset주 떨어진 주"""
+    monday = today - timedelta(days=today.weekday()) + timedelta(weeks=offset)
+    return monday, monday + timedelta(days=6)
+
+
+class DateParser:
+    """상대 날짜 / 요일 / 이번 주·다음 주 / 명시적 날짜와 기간을 한 번의 정규식 탐색으로 해석
+
+    연도 없는 날짜는 올해, 주 지정 없는 요일은 오늘 이후 가장 가까운 그 요일로 본다.
+    """
+
+    def parse_all(self, text, today=None):
+        """text 안의 모든 날짜 표현 (등장 순서, 연결어로 이어진 두 날짜는 기간 하나로)"""
+        if not DATE_TRIGGER.search(text):
+            return []
+        today = today or date.today()
+        matches = []
+        for match in DATE_PATTERN.finditer(text):
+            try:
+                found = self._resolve(match, today)
+            except ValueError:  # 6월 31일 같은 없는 날짜
+                continue
+            previous = matches[-1] if matches else None
+            if previous is not None and not previous.is_range and not found.is_range \
+                    and RANGE_JOINER.fullmatch(text, previous.span[1], found.span[0]):
+                if found.kind == "day":
+                    # "6월 16일부터 20일까지": 월은 앞 날짜를 따름
+                    found.start = found.end = previous.start.replace(day=found.start.day)
+                elif found.kind == "weekday" and text[found.span[0]] in WEEKDAY_CHARS:
+                    # "월요일부터 수요일까지": 주 지정 없는 요일은 앞 날짜 이후로
+                    found.start = found.end = previous.start + timedelta(
+                        days=(found.start.weekday() - previous.start.weekday()) % 7)
+                if found.start > previous.start:
+                    matches[-1] = DateMatch(previous.start, found.start,
+                                            (previous.span[0], found.span[1]), "range")
+                    continue
+            matches.append(found)
+        return matches
+
+    def parse(self, text, today=None):
+        """첫 번째 날짜 표현 (없으면 None)"""
+        matches = self.parse_all(text, today)
+        return matches[0] if matches else None
+
+    def _resolve(self, match, today):
+        kind = match.lastgroup
+        group = match.group
+
+        if kind == "ymd":
+            day = date(int(group("y")), int(group("y_m")), int(group("y_d")))
+        elif kind == "md":
+            day = date(today.year, int(group("k_m")), int(group("k_d")))
+        elif kind == "numeric":
+            day = date(today.year, int(group("n_m")), int(group("n_d")))
+        elif kind == "offset":
+            days = int(group("o_n"))
+            day = today + timedelta(days=-days if group("o_dir") == "전" else days)
+        elif kind == "relative":
+            day = today + timedelta(days=RELATIVE_DAYS[group("relative").lower()])
+        elif kind == "day":
+            day = today.replace(day=int(group("d_d")))
+        elif kind == "weekday":
+            weekday = WEEKDAY_CHARS.index(group("wd"))
+            if group("wd_week"):
+                monday, _ = week_range(today, WEEK_OFFSETS[group("wd_week")])
+                day = monday + timedelta(days=weekday)
+            else:
+                # 이번 주 해당 요일이 지났으면 다음 주
+                day = today + timedelta(days=(weekday - today.weekday()) % 7)
+        else:
+            offset = WEEK_OFFSETS[group("w_week")] if kind == "week" else 0
+            start, end = week_range(today, offset)
+            if kind == "weekend" or group("w_end"):
+                start, kind = end - timedelta(days=1), "weekend"
+            return DateMatch(start, end, match.span(), kind)
+
+        return DateMatch(day, day, match.span(), kind)
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import hashlib
+import json
+import os
+
+import numpy as np
+
+from campus_cache import cache_path
+
+DEFAULT_ENCODER = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
+
+
+def content_hash(passages, model_name):
+    """passage 내용 + 인코더 이름 해시 (바뀌면 색인 재구축)"""
+    digest = hashlib.sha256(model_name.encode("utf-8"))
+    for passage in passages:
+        digest.update(f"\0{passage.path}\0{passage.render()}".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+class TextEncoder:
+    """CPU용 소형 문장 인코더 (mean pooling + L2 정규화)"""
+
+    def __init__(self, model_name=DEFAULT_ENCODER, max_length=128):
+        # 임베딩 모드에서만 필요하므로 여기서 불러옴
+        import torch
+        from transformers import AutoModel, AutoTokenizer
+
+        self.torch = torch
+        self.model_name = model_name
+        self.max_length = max_length
+        self.tokenizer = AutoTokenizer.from_pretrained(model_name)
+        self.model = AutoModel.from_pretrained(model_name).eval()
+
+    def encode(self, texts, batch_size=32):
+        """텍스트 목록 -> (n, dim) float32 단위 벡터"""
+        vectors = []
+        with self.torch.no_grad():
+            for start in range(0, len(texts), batch_size):
+                batch = self.tokenizer(texts[start:start + batch_size], padding=True, truncation=True,
+                                       max_length=self.max_length, return_tensors="pt")
+                hidden = self.model(**batch).last_hidden_state
+                mask = batch["attention_mask"].unsqueeze(-1).to(hidden.dtype)
+                pooled = (hidden * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1e-9)
+                pooled = self.torch.nn.functional.normalize(pooled, dim=-1)
+                vectors.append(pooled.numpy().astype(np.float32))
+        return np.vstack(vectors)
+
+
+class EmbeddingIndex:
+    """Passage 임베딩 검색 색인
+
+    임베딩은 한 번만 계산해 float16 .npy로 저장하고, 이후에는 memory-map으로 연다.
+    passage 내용이나 인코더가 바뀌면 (content_hash가 달라지면) 다시 계산한다.
+    """
+
+    def __init__(self, passages, encoder=None, model_name=DEFAULT_ENCODER,
+                 cache_dir=None):
+        self.passages = passages
+        self.model_name = encoder.model_name if encoder is not None else model_name
+        self._encoder = encoder
+        self.cache_dir = cache_dir or cache_path("embeddings")
+        self.hash = content_hash(passages, self.model_name)
+        self.sections = np.array([passage.section for passage in passages])
+        self.matrix = self.load_or_build()
+
+    @property
+    def encoder(self):
+        # 질문 인코딩이 필요할 때 처음 로드
+        if self._encoder is None:
+            self._encoder = TextEncoder(self.model_name)
+        return self._encoder
+
+    @property
+    def matrix_path(self):
+        return os.path.join(self.cache_dir, f"passages_{self.hash}.npy")
+
+    def load_or_build(self):
+        """저장된 행렬이 있으면 memory-map, 없으면 계산 후 저장"""
+        path = self.matrix_path
+        if not os.path.exists(path):
+            print(f"🧮 passage 임베딩 계산 중... ({len(self.passages)}개, {self.model_name})")
+            vectors = self.encoder.encode([passage.render() for passage in self.passages])
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = path + ".tmp.npy"
+            np.save(tmp_path, vectors.astype(np.float16))
+            os.replace(tmp_path, path)
+            with open(os.path.join(self.cache_dir, f"passages_{self.hash}.json"), "w", encoding="utf-8") as f:
+                json.dump([passage.path for passage in self.passages], f, ensure_ascii=False)
+        return np.load(path, mmap_mode="r")
+
+    def encode_query(self, query):
+        """질문 -> 단위 벡터 (질문당 한 번 계산해 search_vector에 여러 번 넘김)"""
+        return self.encoder.encode([query])[0]
+
+    def search(self, query, k=3, section=None):
+        """코사인 유사도 상위 k개 [(점수, Passage), ...]"""
+        return self.search_vector(self.encode_query(query), k, section)
+
+    def search_vector(self, query_vector, k=3, section=None):
+        """행렬-벡터 곱 한 번 + argpartition으로 상위 k개 선택"""
+        scores = np.asarray(self.matrix @ query_vector, dtype=np.float32)
+        if section is not None:
+            scores[self.sections != section] = -np.inf
+        k = min(k, len(scores))
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(float(scores[i]), self.passages[i]) for i in top if np.isfinite(scores[i])]
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import re
+import threading
+from datetime import datetime
+
+from campus_router import LABELS
+from campus_shuttle import HOLIDAY_WORDS
+
+# 모델 없이 템플릿으로 답하는 의도 (CAMPUS_FASTPATH=shuttle,menu 처럼 일부만 켤 수 있음)
+FAST_INTENTS = ["shuttle", "menu", "graduation_credits", "contacts"]
+
+# 셔틀: 탈것을 직접 말한 질문만 ("시간표", "운행"만 있으면 학사일정 질문일 수 있음)
+SHUTTLE_WORDS = {"셔틀", "버스", "통학"}
+SHUTTLE_ASK_CUES = re.compile(r"몇\s*시|언제|다음\s*(?:셔틀|버스|차)|첫차|막차|첫\s*셔틀|마지막\s*셔틀|남았|놓쳤|방금"
+                              r"|운행\s*(?:해|하나|돼|중)|시간표\s*(?:알려|보여|다시)")
+# 운행 기간/학기/휴일 질문은 operation_overview, non_operation 정보와 함께 모델이 답함
+SHUTTLE_OTHER_CUES = re.compile(r"바뀌|바뀐|변경|연장|연착|중단|붐|간격|편수|종이|이미지|학생증|비\s*오|방학|요일별"
+                                r"|기간|(?<!셔틀)(?<!버스)(?<!차)(?:까지|부터)|학기|" + "|".join(HOLIDAY_WORDS))
+
+# 식단: 메뉴를 묻는 질문만 (가격/운영시간/위치 질문은 모델이 정적 정보로 답함)
+MENU_CUES = re.compile(r"(?:메뉴|식단|(?<!입)학식|밥)\s*(?:표)?\s*(?:은|는|이|가|좀)?\s*(?:뭐|알려|보여|어때)"
+                       r"|뭐\s*(?:나와|나오|먹)")
+MENU_OTHER_CUES = re.compile(r"가격|얼마|운영\s*시간|몇\s*시|위치|어디|결제|카드|맛있|추천|떨어|알레르기")
+MEAL_CUES = {"조식": re.compile(r"아침|조식"), "중식": re.compile(r"점심|중식"), "석식": re.compile(r"저녁|석식")}
+CAFETERIA_CUES = {
+    "제1학생회관": re.compile(r"1\s*학|제1학생회관"),
+    "제2학생회관": re.compile(r"2\s*학|제2학생회관"),
+    "제3학생회관": re.compile(r"3\s*학|제3학생회관"),
+    "상록회관": re.compile(r"상록"),
+    "생활과학대학": re.compile(r"생과대|생활과학"),
+    "학생생활관": re.compile(r"긱사|기숙|생활관"),
+}
+
+# 졸업학점: 전체 기준 학점만 (학과/영역별 요건, 예외 상황은 모델이 답함)
+CREDIT_CUES = re.compile(r"졸업.*학점|학점.*졸업")
+CREDIT_AMOUNT_CUES = re.compile(r"몇|최소|총|기준|얼마|이수해야|필요")
+CREDIT_OTHER_CUES = re.compile(r"전공|교양|학과|학부|공학|의대|의과|약대|수의|건축|영어|평점|성적|조기|편입|계절"
+                               r"|인정|못|안\s*채|부족|불가|초과")
+
+# 연락처: 전화번호를 묻고 부서(또는 담당 업무)가 나오는 질문
+CONTACT_CUES = re.compile(r"전화|연락처|번호|문의처|어디로\s*문의")
+DEPARTMENT_ALIASES = {"생협": "생활협동조합", "학사지원": "학사지원과", "학생지원": "학생지원과"}
+
+
+class FastPathEngine:
+    """구조화된 데이터로 바로 답할 수 있는 질문을 템플릿으로 처리 (model.generate 생략)
+
+    의도마다 조건이 확실할 때만 답하고, 아니면 None을 돌려 기존 RAG 경로로 넘긴다.
+    """
+
+    def __init__(self, knowledge_base, enabled=None):
+        self.kb = knowledge_base
+        self.handlers = {
+            "shuttle": self.answer_shuttle,
+            "menu": self.answer_menu,
+            "graduation_credits": self.answer_graduation_credits,
+            "contacts": self.answer_contacts,
+        }
+        self.enabled = {intent: enabled is None or intent in enabled for intent in FAST_INTENTS}
+
+        # 부서 이름/담당 업무 -> 부서 ("042-821-5025 (졸업요건, 학사일정)")
+        self.contacts = knowledge_base.static_knowledge["contacts"]
+        self.department_cues = {department: department for department in self.contacts}
+        self.department_cues.update(DEPARTMENT_ALIASES)
+        for department, value in self.contacts.items():
+            duties = re.search(r"\((.*)\)", value)
+            for duty in (duties.group(1).split(",") if duties else []):
+                self.department_cues.setdefault(duty.strip(), department)
+        self.department_pattern = re.compile("|".join(
+            re.escape(cue) for cue in sorted(self.department_cues, key=len, reverse=True)))
+        # 부서가 다루는 질문 주제 (학사지원과 -> 졸업요건/학사일정, 생활협동조합 -> 식단 ...)
+        self.department_topics = {}
+        for department, value in self.contacts.items():
+            route = knowledge_base.router.route(f"{department} {value}")
+            self.department_topics[department] = {label for label in LABELS if route.has(label)}
+
+        # 통계
+        self.lock = threading.Lock()
+        self.questions = 0
+        self.hits = {intent: 0 for intent in FAST_INTENTS}
+
+    @classmethod
+    def from_env(cls, knowledge_base, value):
+        """CAMPUS_FASTPATH 값 ("" = 전부, "none" = 끔, "shuttle,menu" = 일부)"""
+        value = (value or "").strip()
+        if not value:
+            return cls(knowledge_base)
+        if value.lower() in ("none", "off", "0"):
+            return cls(knowledge_base, enabled=set())
+        return cls(knowledge_base, enabled={name.strip() for name in value.split(",")})
+
+    def answer(self, question, now=None, route=None, topics=None):
+        """(의도, 답변) 또는 None
+
+        route/topics를 넘기면 재사용 (모델 경로에서도 쓰므로 분류기는 요청당 한 번만)
+        """
+        now = now or datetime.now()
+        route = route or self.kb.router.route(question)
+        topics = self.kb.predict_topics(question, route) if topics is None else topics
+
+        result = None
+        for intent in FAST_INTENTS:
+            if not self.enabled[intent]:
+                continue
+            text = self.handlers[intent](question, route, topics, now)
+            if text:
+                result = (intent, text)
+                break
+
+        with self.lock:
+            self.questions += 1
+            if result:
+                self.hits[result[0]] += 1
+        return result
+
+    def answer_shuttle(self, question, route, topics, now):
+        """셔틀 시간 질문 -> 시간표 계산 결과"""
+        if "shuttle" not in topics or not SHUTTLE_WORDS & set(route.keywords("shuttle")):
+            return None
+        if not SHUTTLE_ASK_CUES.search(question) or SHUTTLE_OTHER_CUES.search(question):
+            return None
+        # 식단/공지/졸업 질문이 섞여 있으면 모델이 답하도록 둠
+        if topics & {"graduation", "notice", "dining"}:
+            return None
+        return self.kb.shuttle_schedule.answer(question, now)
+
+    def answer_menu(self, question, route, topics, now):
+        """하루치 식단 질문 -> 식단표의 meals 목록"""
+        if topics != {"dining"} or route.has("dining_week"):
+            return None
+        if not MENU_CUES.search(question) or MENU_OTHER_CUES.search(question):
+            return None
+        when = self.kb.date_parser.parse(question, now.date())
+        if when is not None and when.is_range:
+            return None
+
+        menu = self.kb.get_menu((when.start if when else now.date()).strftime("%Y.%m.%d"))
+        if not isinstance(menu, dict) or menu.get("status") != "success":
+            return None
+
+        cafeterias = [name for name, cue in CAFETERIA_CUES.items() if cue.search(question)]
+        meal_types = [meal_type for meal_type, cue in MEAL_CUES.items() if cue.search(question)]
+        target = "교직원" if "교직원" in question else "학생"
+        meals = [meal for meal in menu["meals"]
+                 if meal["target"] in (target, "전체")
+                 and (not cafeterias or meal["cafeteria"] in cafeterias)
+                 and (not meal_types or meal["meal_type"] in meal_types)]
+        if not meals:
+            return None  # 해당 식당/끼니가 식단표에 없으면 모델이 안내
+
+        lines = [f"📅 {menu['date']} 식단 ({target})"]
+        for meal in meals:
+            items = [item for item in meal["menu"] if not item.endswith("원")]
+            prices = [item for item in meal["menu"] if item.endswith("원")]
+            price = f" ({prices[0]})" if prices else ""
+            lines.append(f"• {meal['cafeteria']} {meal['meal_type']}: {', '.join(items)}{price}")
+        return "\n".join(lines)
+
+    def answer_graduation_credits(self, question, route, topics, now):
+        """전체 졸업 기준 학점 질문 -> graduation.overview"""
+        if topics != {"graduation"} or not CREDIT_CUES.search(question):
+            return None
+        if not CREDIT_AMOUNT_CUES.search(question) or CREDIT_OTHER_CUES.search(question):
+            return None
+        overview = self.kb.static_knowledge["graduation"]["overview"]
+        return (f"{overview['university']} 졸업 기준 학점은 {overview['standard_credits']}학점입니다 "
+                f"({overview['legal_basis']}). {overview['note']}. 문의: {overview['contact']}")
+
+    def answer_contacts(self, question, route, topics, now):
+        """부서 전화번호 질문 -> contacts"""
+        if not CONTACT_CUES.search(question):
+            return None
+        departments = list(dict.fromkeys(self.department_cues[match.group()]
+                                         for match in self.department_pattern.finditer(question)))
+        if not departments:
+            return None
+        # 부서 업무 밖의 주제(셔틀 시간표 + 학생지원과 번호 등)가 섞여 있으면 모델이 답하도록 둠
+        if not topics <= set().union(*(self.department_topics[department] for department in departments)):
+            return None
+        return "\n".join(f"📞 {department}: {self.contacts[department]}" for department in departments)
+
+    def stats(self):
+        with self.lock:
+            hits = sum(self.hits.values())
+            return {
+                "questions": self.questions,
+                "hits": dict(self.hits),
+                "hit_rate": round(hits / self.questions, 3) if self.questions else 0.0,
+                "enabled": [intent for intent in FAST_INTENTS if self.enabled[intent]],
+            }
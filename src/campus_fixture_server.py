@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""식단/공지 응답 녹화 + 로컬 재생 서버
+
+학교 서버에 부하를 주지 않고 크롤러를 벤치마크하기 위한 도구.
+record: 실제 식단/공지 응답을 fixture 파일로 저장 (../data/fixtures/index.json에 등록)
+serve: 저장된 응답을 지연/오류 주입과 함께 로컬 HTTP로 재생
+
+사용법:
+  cd src && python campus_fixture_server.py record --dates 2025.06.18 --pages 3
+  cd src && python campus_fixture_server.py serve --port 8765 --latency 0.05 --error-rate 0.1
+  CAMPUS_BASE_URL=http://127.0.0.1:8765 python chatbot_model.py
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "fixtures")
+INDEX_FILE = "index.json"
+
+
+def fixture_key(query):
+    """쿼리 문자열(또는 dict)을 정렬된 키로 변환 (파라미터 순서 무관)"""
+    if isinstance(query, dict):
+        pairs = [(k, str(v)) for k, v in query.items()]
+    else:
+        pairs = parse_qsl(query or "", keep_blank_values=True)
+    return urlencode(sorted(pairs))
+
+
+def load_index(fixture_dir=FIXTURE_DIR):
+    """경로별 fixture 목록 {path: {"default": 파일, "queries": {쿼리키: 파일}}}"""
+    path = os.path.join(fixture_dir, INDEX_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_index(index, fixture_dir=FIXTURE_DIR):
+    os.makedirs(fixture_dir, exist_ok=True)
+    path = os.path.join(fixture_dir, INDEX_FILE)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+class FixtureRecorder:
+    """실제 응답을 fixture 파일로 저장"""
+
+    def __init__(self, http, fixture_dir=FIXTURE_DIR):
+        self.http = http
+        self.fixture_dir = fixture_dir
+        self.index = load_index(fixture_dir)
+
+    def record(self, name, url, params=None, default=False):
+        """GET 응답 본문을 name.html로 저장하고 index에 등록"""
+        response = self.http.get(url, params=params)
+        filename = re.sub(r"[^\w.-]", "_", name) + ".html"
+        os.makedirs(self.fixture_dir, exist_ok=True)
+        with open(os.path.join(self.fixture_dir, filename), "wb") as f:
+            f.write(response.content)
+
+        route = self.index.setdefault(urlsplit(url).path, {"queries": {}})
+        route["queries"][fixture_key(params or {})] = filename
+        if default:
+            route["default"] = filename
+        print(f"📼 {filename} 저장 ({len(response.content) / 1024:.1f} KB)")
+        return filename
+
+    def record_knowledge_base(self, kb, dates, pages=3, cafeteria_codes=None):
+        """지식 베이스의 식단/공지 요청을 그대로 녹화"""
+        for i, date_str in enumerate(dates):
+            for code in cafeteria_codes or [None]:
+                params = kb.menu_params(date_str, code) if code else kb.menu_params(date_str)
+                name = f"menu_{date_str}" + (f"_{code}" if code else "")
+                # 녹화하지 않은 날짜는 첫 날짜 식단으로 응답
+                self.record(name, kb.urls["menu"], params, default=(i == 0 and code is None))
+
+        # 녹화 범위 밖의 공지 페이지는 기존 default(빈 게시판)로 응답
+        for page in range(1, pages + 1):
+            self.record(f"notice_page{page}", kb.urls["notice_board"], kb.notice_params(page))
+
+        save_index(self.index, self.fixture_dir)
+
+
+class FixtureServer:
+    """녹화된 응답을 재생하는 로컬 HTTP 서버
+
+    latency: 응답 전 지연 (초), jitter: 지연에 더할 최대 무작위 값 (초)
+    error_rate: error_status로 응답할 확률 (seed로 재현 가능)
+    쿼리가 일치하는 fixture가 없으면 경로의 default fixture, 그것도 없으면 404
+    conditional: ETag/Last-Modified를 붙이고 조건부 요청에 304로 응답
+    compress: Accept-Encoding에 gzip이 있으면 압축해서 응답
+    """
+
+    def __init__(self, fixture_dir=FIXTURE_DIR, host="127.0.0.1", port=0,
+                 latency=0.0, jitter=0.0, error_rate=0.0, error_status=503, seed=None,
+                 conditional=True, compress=True):
+        self.fixture_dir = fixture_dir
+        self.conditional = conditional
+        self.compress = compress
+        self.index = load_index(fixture_dir)
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._bodies = {}
+        self._thread = None
+
+        # 통계
+        self.requests = 0
+        self.errors_injected = 0
+        self.not_found = 0
+        self.not_modified = 0
+        self.bytes_sent = 0
+
+        self.httpd = ThreadingHTTPServer((host, port), self._make_handler())
+        self.httpd.daemon_threads = True
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def resolve(self, path, query):
+        """요청 경로/쿼리에 해당하는 fixture 파일명 (없으면 None)"""
+        route = self.index.get(path)
+        if route is None:
+            return None
+        return route.get("queries", {}).get(fixture_key(query)) or route.get("default")
+
+    def body(self, filename):
+        """fixture 본문 {"raw", "gzip", "etag", "last_modified"} (한 번 읽은 파일은 메모리에 보관)"""
+        with self._lock:
+            entry = self._bodies.get(filename)
+        if entry is None:
+            path = os.path.join(self.fixture_dir, filename)
+            with open(path, "rb") as f:
+                data = f.read()
+            entry = {
+                "raw": data,
+                "gzip": gzip.compress(data),
+                "etag": '"%s"' % hashlib.md5(data).hexdigest(),
+                "last_modified": formatdate(os.path.getmtime(path), usegmt=True)
+            }
+            with self._lock:
+                self._bodies[filename] = entry
+        return entry
+
+    def _plan(self):
+        """이번 요청의 지연 시간과 오류 주입 여부"""
+        with self._lock:
+            self.requests += 1
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+            fail = self.error_rate > 0 and self._random.random() < self.error_rate
+            if fail:
+                self.errors_injected += 1
+        return delay, fail
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                delay, fail = server._plan()
+                if delay:
+                    time.sleep(delay)
+                if fail:
+                    self._send(server.error_status, b"injected error", "text/plain")
+                    return
+
+                split = urlsplit(self.path)
+                filename = server.resolve(split.path, split.query)
+                if filename is None:
+                    with server._lock:
+                        server.not_found += 1
+                    self._send(404, b"fixture not found", "text/plain")
+                    return
+
+                entry = server.body(filename)
+                headers = {}
+                if server.conditional:
+                    headers["ETag"] = entry["etag"]
+                    headers["Last-Modified"] = entry["last_modified"]
+                    if (self.headers.get("If-None-Match") == entry["etag"]
+                            or self.headers.get("If-Modified-Since") == entry["last_modified"]):
+                        with server._lock:
+                            server.not_modified += 1
+                        self._send(304, b"", None, headers)
+                        return
+
+                body = entry["raw"]
+                if server.compress and "gzip" in self.headers.get("Accept-Encoding", ""):
+                    body = entry["gzip"]
+                    headers["Content-Encoding"] = "gzip"
+                self._send(200, body, "text/html; charset=utf-8", headers)
+
+            def _send(self, status, body, content_type, headers=None):
+                self.send_response(status)
+                if content_type:
+                    self.send_header("Content-Type", content_type)
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                if status != 304:
+                    self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                with server._lock:
+                    server.bytes_sent += len(body)
+                if body:
+                    self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # 벤치마크 출력에 섞이지 않도록 접근 로그 생략
+
+        return Handler
+
+    def start(self):
+        """백그라운드 스레드에서 서버 시작 (base_url 반환)"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.httpd.serve_forever, name="campus-fixture-server",
+                                            daemon=True)
+            self._thread.start()
+        return self.base_url
+
+    def stop(self):
+        if self._thread is not None:
+            self.httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.httpd.server_close()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "errors_injected": self.errors_injected,
+                "not_found": self.not_found,
+                "not_modified": self.not_modified,
+                "bytes_sent": self.bytes_sent
+            }
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="식단/공지 응답 녹화 및 로컬 재생 서버")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    serve = sub.add_parser("serve", help="녹화된 응답 재생")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--latency", type=float, default=0.0, help="응답 지연 (초)")
+    serve.add_argument("--jitter", type=float, default=0.0, help="추가 무작위 지연 최대값 (초)")
+    serve.add_argument("--error-rate", type=float, default=0.0, help="오류 응답 비율 (0~1)")
+    serve.add_argument("--error-status", type=int, default=503)
+    serve.add_argument("--seed", type=int, default=None)
+    serve.add_argument("--no-conditional", action="store_true", help="ETag/Last-Modified 비활성화")
+    serve.add_argument("--no-compress", action="store_true", help="gzip 압축 비활성화")
+    serve.add_argument("--fixture-dir", default=FIXTURE_DIR)
+
+    record = sub.add_parser("record", help="실제 응답 녹화")
+    record.add_argument("--dates", nargs="+", required=True, help="식단 날짜 (YYYY.MM.DD)")
+    record.add_argument("--pages", type=int, default=3, help="공지사항 페이지 수")
+    record.add_argument("--all-cafeterias", action="store_true", help="모든 식당 코드 녹화")
+    record.add_argument("--fixture-dir", default=FIXTURE_DIR)
+
+    args = parser.parse_args()
+
+    if args.command == "record":
+        # 모델 로딩 없이 지식 베이스의 URL/파라미터만 사용
+        from chatbot_model import CompleteCampusKnowledgeBase
+        kb = CompleteCampusKnowledgeBase()
+        codes = list(kb.cafeteria_codes) if args.all_cafeterias else None
+        FixtureRecorder(kb.http, args.fixture_dir).record_knowledge_base(kb, args.dates, args.pages, codes)
+        return
+
+    server = FixtureServer(args.fixture_dir, args.host, args.port, args.latency, args.jitter,
+                           args.error_rate, args.error_status, args.seed,
+                           conditional=not args.no_conditional, compress=not args.no_compress)
+    print(f"📡 fixture 서버 실행 중: {server.base_url} (Ctrl+C로 종료)")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        print(f"⏹️ fixture 서버 종료 {server.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import threading
+import time
+
+import torch
+from transformers import StoppingCriteria
+
+
+class GenerationProfile:
+    """질문 유형별 생성 설정 (토큰 상한, 디코딩 방식, thinking 여부, 제한 시간)"""
+
+    __slots__ = ("name", "max_new_tokens", "do_sample", "temperature", "top_p", "enable_thinking", "deadline")
+
+    def __init__(self, name, max_new_tokens, do_sample=False, temperature=0.7, top_p=0.8,
+                 enable_thinking=False, deadline=20.0):
+        self.name = name
+        self.max_new_tokens = max_new_tokens
+        self.do_sample = do_sample
+        self.temperature = temperature
+        self.top_p = top_p
+        self.enable_thinking = enable_thinking
+        self.deadline = deadline  # 초
+
+    def generate_kwargs(self):
+        kwargs = {"max_new_tokens": self.max_new_tokens, "do_sample": self.do_sample}
+        if self.do_sample:
+            kwargs.update(temperature=self.temperature, top_p=self.top_p)
+        return kwargs
+
+    def __repr__(self):
+        mode = "sample" if self.do_sample else "greedy"
+        return (f"GenerationProfile({self.name}, {self.max_new_tokens} tokens, {mode}, "
+                f"thinking={self.enable_thinking}, {self.deadline}s)")
+
+
+# 식단/셔틀/공지/학사일정은 컨텍스트를 그대로 옮기면 되므로 짧게 greedy,
+# 졸업요건은 조건을 풀어 설명해야 해서 조금 길게 샘플링 (Qwen3 non-thinking 권장값)
+PROFILES = {
+    "dining": GenerationProfile("dining", 384),
+    "shuttle": GenerationProfile("shuttle", 256),
+    "notice": GenerationProfile("notice", 384),
+    "academic_schedule": GenerationProfile("academic_schedule", 512),
+    "graduation": GenerationProfile("graduation", 768, do_sample=True),
+    "default": GenerationProfile("default", 512, do_sample=True),
+}
+# CAMPUS_THINKING=1일 때 (Qwen3 thinking 권장값, 추론 토큰까지 들어가도록 상한을 넉넉히)
+THINKING_PROFILE = GenerationProfile("thinking", 4096, do_sample=True, temperature=0.6, top_p=0.95,
+                                     enable_thinking=True, deadline=60.0)
+
+
+def profiles_version(thinking=False):
+    """생성 설정 전체를 나타내는 문자열 (답변 캐시 네임스페이스용, 모든 설정값 포함)"""
+    profiles = [THINKING_PROFILE] if thinking else [PROFILES[name] for name in sorted(PROFILES)]
+    return repr([tuple(getattr(profile, slot) for slot in GenerationProfile.__slots__) for profile in profiles])
+
+
+def select_profile(topics, thinking=False):
+    """질문 주제에 맞는 생성 설정 (여러 주제면 토큰 상한이 가장 큰 설정)"""
+    if thinking:
+        return THINKING_PROFILE
+    candidates = [PROFILES[topic] for topic in topics if topic in PROFILES]
+    if not candidates:
+        return PROFILES["default"]
+    return max(candidates, key=lambda profile: profile.max_new_tokens)
+
+
+class StopOnTokenOrDeadline(StoppingCriteria):
+    """종료 토큰(<|im_end|> 등)이 나오거나 제한 시간이 지나면 생성 중단 (중단 사유 기록)"""
+
+    def __init__(self, stop_ids, deadline):
+        self.stop_ids = set(stop_ids)
+        self.deadline = deadline
+        self.started = time.monotonic()
+        self.reason = None
+
+    def __call__(self, input_ids, scores, **kwargs):
+        done = input_ids[:, -1].tolist()
+        if all(token in self.stop_ids for token in done):
+            self.reason = "stop_token"
+        elif time.monotonic() - self.started > self.deadline:
+            self.reason = "deadline"
+        stop = self.reason is not None
+        return torch.full((input_ids.shape[0],), stop, dtype=torch.bool, device=input_ids.device)
+
+
+class GenerationStats:
+    """요청별 생성 토큰 수 vs 답변으로 남은 토큰 수 집계"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests = 0
+        self.generated_tokens = 0
+        self.kept_tokens = 0
+        self.stopped = {}
+
+    def record(self, generated, kept, reason):
+        with self.lock:
+            self.requests += 1
+            self.generated_tokens += generated
+            self.kept_tokens += kept
+            self.stopped[reason] = self.stopped.get(reason, 0) + 1
+
+    def stats(self):
+        with self.lock:
+            return {
+                "requests": self.requests,
+                "generated_tokens": self.generated_tokens,
+                "kept_tokens": self.kept_tokens,
+                "kept_ratio": round(self.kept_tokens / self.generated_tokens, 3) if self.generated_tokens else 0.0,
+                "stopped": dict(self.stopped),
+            }
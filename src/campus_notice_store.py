@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import threading
+
+
+def notice_key(notice):
+    """공지 식별 키 (게시물 번호가 있으면 번호, 없으면 제목+날짜+작성자)"""
+    if notice.get("id"):
+        return f"id:{notice['id']}"
+    return f"{notice.get('title', '')}|{notice.get('date', '')}|{notice.get('writer', '')}"
+
+
+class NoticeStore:
+    """이미 수집한 공지사항 저장소 (CampusSnapshotDB의 notices 테이블 하나를 사용)
+
+    워커/재시작 간에 같은 테이블을 보므로 다른 워커가 받은 공지도 다시 받지 않는다.
+    """
+
+    def __init__(self, db, max_items=500):
+        self.db = db
+        self.max_items = max_items
+        self._lock = threading.Lock()
+
+    def is_known(self, notice):
+        return bool(self.db.known_notice_keys([notice_key(notice)]))
+
+    def unseen(self, notices):
+        """아직 저장되지 않은 공지만 반환"""
+        known = self.db.known_notice_keys({notice_key(notice) for notice in notices})
+        return [notice for notice in notices if notice_key(notice) not in known]
+
+    def add(self, new_notices):
+        """새 공지를 앞쪽(최신)에 추가하고 max_items개만 남김 (추가할 공지가 없어도 수집 시각 갱신)"""
+        with self._lock:
+            # 페이지가 밀려 같은 공지가 두 번 들어온 경우 한 번만
+            keys, unique = set(), []
+            for notice in new_notices:
+                key = notice_key(notice)
+                if key not in keys:
+                    keys.add(key)
+                    unique.append(notice)
+            added = self.unseen(unique)
+            self.db.save_notices(added, notice_key, keep=self.max_items)
+            return len(added)
+
+    def latest(self, limit=None):
+        """저장된 공지 (최신순)"""
+        return self.db.load_notices(limit=limit or self.max_items) or []
+
+    def __len__(self):
+        return self.db.count_notices()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+from urllib.parse import parse_qs, urlsplit
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+# lxml이 설치되어 있으면 사용 (html.parser보다 빠름)
+try:
+    import lxml  # noqa: F401
+    DEFAULT_PARSER = "lxml"
+except ImportError:
+    DEFAULT_PARSER = "html.parser"
+
+MENU_SKIP_WORDS = ["운영안함", "메뉴운영내역", "준비중"]
+
+
+def decode_body(content, encoding="utf-8"):
+    """응답 바이트를 한 번만 디코딩 (이미 문자열이면 그대로)"""
+    if isinstance(content, bytes):
+        return content.decode(encoding, errors="replace")
+    return content
+
+
+def make_soup(markup, name, class_, parser=None, strainer=True):
+    """필요한 하위 트리만 파싱 (strainer=False면 페이지 전체 파싱)"""
+    parse_only = SoupStrainer(name, class_=class_) if strainer else None
+    return BeautifulSoup(decode_body(markup), parser or DEFAULT_PARSER, parse_only=parse_only)
+
+
+def parse_menu_table(markup, parser=None, strainer=True):
+    """식단표(table.menu-tbl.type-cap) 파싱
+
+    식단표가 없으면 None, 있으면 meals 리스트 반환
+    """
+    soup = make_soup(markup, "table", "menu-tbl type-cap", parser, strainer)
+    table = soup.find("table", class_="menu-tbl type-cap")
+    if not table:
+        return None
+
+    meals = []
+    current_meal_type = None
+    current_target = None
+
+    # 식당명 추출 (구분/대상 열 제외)
+    headers = table.find("thead")
+    tbody = table.find("tbody")
+    if not headers or not tbody:
+        return meals
+
+    header_cells = headers.find_all("th")[2:]
+    cafeteria_names = [th.get_text(strip=True) for th in header_cells]
+
+    for row in tbody.find_all("tr"):
+        cols = row.find_all("td")
+        if not cols:
+            continue
+
+        # rowspan이 있는 경우 (새로운 식사 타입)
+        if 'rowspan' in cols[0].attrs:
+            current_meal_type = cols[0].get_text(strip=True)
+            if len(cols) > 1:
+                current_target = cols[1].get_text(strip=True)
+                menu_cols = cols[2:]
+            else:
+                current_target = "전체"
+                menu_cols = []
+        else:
+            current_target = cols[0].get_text(strip=True)
+            menu_cols = cols[1:]
+
+        # 각 식당별 메뉴 처리
+        for idx, col in enumerate(menu_cols):
+            if idx >= len(cafeteria_names):
+                continue
+
+            menu_html = col.find("p")
+            if menu_html:
+                menu_text = menu_html.get_text(separator="\n", strip=True)
+            else:
+                menu_text = col.get_text(strip=True)
+
+            # 운영하지 않는 경우 제외
+            if any(skip_word in menu_text for skip_word in MENU_SKIP_WORDS):
+                continue
+
+            menu_lines = [line.strip() for line in menu_text.split("\n") if line.strip()]
+            if menu_lines:
+                meals.append({
+                    "meal_type": current_meal_type or "정보없음",
+                    "target": current_target or "전체",
+                    "cafeteria": cafeteria_names[idx],
+                    "menu": menu_lines
+                })
+
+    return meals
+
+
+def parse_notice_list(markup, parser=None, strainer=True):
+    """공지사항 목록(div.board_list) 파싱
+
+    board_list가 없으면 None, 있으면 공지 리스트 반환
+    """
+    soup = make_soup(markup, "div", "board_list", parser, strainer)
+    board_div = soup.find("div", class_="board_list")
+    if not board_div:
+        return None
+
+    notices = []
+    for row in board_div.find_all("tr")[1:]:  # 첫 번째는 헤더
+        cols = row.find_all("td")
+        if len(cols) < 4:
+            continue
+
+        title_tag = cols[1].find("a")
+        if not title_tag:
+            continue
+
+        notice = {
+            "title": title_tag.get_text(strip=True),
+            "writer": cols[2].get_text(strip=True),
+            "date": cols[3].get_text(strip=True)
+        }
+        # 게시물 번호 (링크의 no 파라미터, 제목이 바뀌어도 같은 공지로 인식)
+        post_id = parse_qs(urlsplit(title_tag.get("href", "")).query).get("no")
+        if post_id:
+            notice["id"] = post_id[0]
+        notices.append(notice)
+
+    return notices
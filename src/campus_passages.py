@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import math
+import re
+from collections import Counter
+
+TOKEN_PATTERN = re.compile(r"[0-9a-z]+|[가-힣]+")
+
+# 영문 키의 한국어 표기 (한국어 질문과 매칭되도록 passage 제목/본문에 사용)
+KEY_LABELS = {
+    "graduation": "졸업요건", "academic_schedule": "학사일정", "dining": "식당", "shuttle": "셔틀버스",
+    "notice": "공지사항", "contacts": "연락처",
+    "overview": "개요", "basic_structure": "기본 구조", "course_categories": "과목 구분",
+    "credit_distribution_by_type": "전공 유형별 학점 배분", "liberal_arts_detailed": "교양 세부",
+    "mandatory_courses": "필수 교양", "special_requirements": "특별 요건",
+    "english_requirements": "영어 졸업인증 요건", "major_requirements_by_department": "학과별 전공 요건",
+    "required_courses": "필수 과목", "grade_requirements": "졸업 평점 요건",
+    "additional_requirements": "추가 요건", "future_design_counseling": "미래설계상담",
+    "special_programs": "특별 과정", "special_cases": "특수 학과", "important_notes": "유의사항",
+    "contact_information": "문의처", "contact_info": "문의처", "useful_tips": "팁", "helpful_tips": "팁",
+    "first_semester": "1학기", "second_semester": "2학기", "registration": "수강신청",
+    "pre_registration": "예비수강신청", "main_registration": "본 수강신청",
+    "confirmation_change": "수강신청 확인 및 변경", "cancellation": "수강신청 취소", "tuition": "등록금 납부",
+    "semester_dates": "학기 주요 날짜", "exam_periods": "시험 기간", "midterm": "중간고사", "final": "기말고사",
+    "grade_announcement": "성적 발표", "vacation": "방학", "summer_session": "여름 계절학기",
+    "winter_session": "겨울 계절학기", "special_applications": "각종 신청", "leave_return": "휴학 복학",
+    "early_graduation": "조기졸업", "thesis_deferral": "학위취득 유예", "convergence_major": "융복합창의전공",
+    "curriculum_change": "교육과정 변경", "ceremonies_events": "행사", "entrance_ceremony": "입학식",
+    "graduation_ceremonies": "학위수여식", "february": "2월", "august": "8월", "founding_day": "개교기념일",
+    "online_systems": "온라인 시스템", "cnu_portal": "CNU 포털", "main_website": "홈페이지",
+    "student_restaurant": "학생식당(학식)", "faculty_restaurant": "교직원식당", "cafeteria": "카페",
+    "hours": "운영시간", "breakfast": "아침", "lunch": "점심", "dinner": "저녁",
+    "operation_overview": "운행 개요", "campus_internal": "교내 순환", "campus_circulation": "캠퍼스 순환",
+    "external_stops": "외부 정류장", "schedule": "시간표", "route_stops": "정류장", "route": "노선",
+    "return_route": "복귀 노선", "first_bus": "첫차", "last_bus": "막차", "departure": "출발",
+    "arrival": "도착", "frequency": "운행 횟수", "period": "기간", "periods": "기간", "date": "날짜",
+    "deadline": "마감", "description": "설명", "requirement": "요건", "requirements": "요건",
+    "total_credits": "총 학점", "credits": "학점", "minimum_credits": "최소 학점",
+    "standard_credits": "기준 졸업학점", "contact": "문의", "phone": "전화", "services": "업무",
+    "location": "위치", "price": "가격", "korean": "한식", "western": "양식", "chinese": "중식",
+    "special": "특식", "note": "비고", "notes": "비고", "tracks": "트랙", "courses": "과목",
+    "scholarship": "장학금", "non_operation": "미운행", "operation_days": "운행일",
+    "start_date": "시작일", "last_class": "수업 종료", "classes_start": "수업 시작", "payment_period": "납부 기간",
+    "quarter_point": "수업일수 1/4선", "third_point": "수업일수 1/3선", "half_point": "수업일수 1/2선",
+    "two_thirds_point": "수업일수 2/3선", "three_quarters_point": "수업일수 3/4선",
+}
+
+
+def label(key):
+    return KEY_LABELS.get(key, key)
+
+
+class Passage:
+    """정적 지식의 검색 단위 (예: graduation.english_requirements.공인영어시험_면제기준)"""
+
+    __slots__ = ("path", "section", "title", "text", "line")
+
+    def __init__(self, path, title, text):
+        self.path = path
+        self.section = path.split(".", 1)[0]
+        self.title = title
+        self.text = text
+        # 프롬프트에 그대로 넣는 한 줄 (정적 지식이라 로드 시 한 번만 만듦)
+        self.line = f"• {title}: {text}\n"
+
+    def render(self):
+        return f"{self.title}: {self.text}"
+
+    def __repr__(self):
+        return f"Passage({self.path!r}, {self.render()[:40]!r})"
+
+
+def format_value(value):
+    if isinstance(value, list):
+        return ", ".join(format_value(item) for item in value)
+    if isinstance(value, dict):
+        return ", ".join(f"{label(key)}: {format_value(item)}" for key, item in value.items())
+    return str(value)
+
+
+def flatten_knowledge(knowledge, max_chars=300):
+    """중첩 dict를 경로가 붙은 Passage 목록으로 펼침
+
+    각 dict 노드의 스칼라/리스트 값은 "키: 값" 줄로 묶어 그 경로의 passage가 되고,
+    하위 dict는 경로를 이어 붙여 따로 펼친다.
+    max_chars를 넘는 passage는 줄 단위로 나눈다 (경로 뒤에 #1, #2).
+    """
+    passages = []
+
+    def emit(path, lines):
+        title = " > ".join(label(key) for key in path)
+        chunks, current = [], []
+        for line in lines:
+            if current and len("; ".join(current + [line])) > max_chars:
+                chunks.append(current)
+                current = []
+            current.append(line)
+        if current:
+            chunks.append(current)
+        for i, chunk in enumerate(chunks):
+            suffix = f"#{i + 1}" if len(chunks) > 1 else ""
+            passages.append(Passage(".".join(path) + suffix, title, "; ".join(chunk)))
+
+    def walk(node, path):
+        if isinstance(node, list):
+            emit(path, [format_value(item) for item in node])
+            return
+        if not isinstance(node, dict):
+            emit(path, [format_value(node)])
+            return
+
+        lines = []
+        children = []
+        for key, value in node.items():
+            if isinstance(value, dict) or (isinstance(value, list) and any(isinstance(item, dict) for item in value)):
+                children.append((key, value))
+            else:
+                lines.append(f"{label(key)}: {format_value(value)}")
+        if lines:
+            emit(path, lines)
+        for key, value in children:
+            walk(value, path + [key])
+
+    for section, node in knowledge.items():
+        walk(node, [section])
+    return passages
+
+
+def tokenize(text):
+    """한글은 음절 bigram, 영문/숫자는 단어 단위로 토큰화"""
+    tokens = []
+    for word in TOKEN_PATTERN.findall(text.lower()):
+        if word[0] < "가" or len(word) == 1:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+class BM25Index:
+    """Passage 목록 위의 BM25 역색인 (시작할 때 한 번 구축)"""
+
+    def __init__(self, passages, k1=1.5, b=0.75):
+        self.passages = passages
+        self.k1 = k1
+        self.b = b
+
+        self.postings = {}  # 토큰 -> [(문서 번호, 빈도), ...]
+        self.doc_lengths = []
+        for doc_id, passage in enumerate(passages):
+            counts = Counter(tokenize(f"{passage.title} {passage.text}"))
+            self.doc_lengths.append(sum(counts.values()))
+            for token, freq in counts.items():
+                self.postings.setdefault(token, []).append((doc_id, freq))
+
+        total = len(passages)
+        self.avg_length = (sum(self.doc_lengths) / total) if total else 0.0
+        self.idf = {
+            token: math.log(1 + (total - len(docs) + 0.5) / (len(docs) + 0.5))
+            for token, docs in self.postings.items()
+        }
+
+    def search(self, query, k=3, section=None):
+        """점수 높은 순 [(점수, Passage), ...] (section이 있으면 해당 섹션만)"""
+        scores = {}
+        for token in set(tokenize(query)):
+            idf = self.idf.get(token)
+            if idf is None:
+                continue
+            for doc_id, freq in self.postings[token]:
+                norm = self.k1 * (1 - self.b + self.b * self.doc_lengths[doc_id] / self.avg_length)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * freq * (self.k1 + 1) / (freq + norm)
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        results = []
+        for doc_id, score in ranked:
+            passage = self.passages[doc_id]
+            if section is not None and passage.section != section:
+                continue
+            results.append((score, passage))
+            if len(results) >= k:
+                break
+        return results
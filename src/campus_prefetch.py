@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import threading
+import time
+from datetime import date, timedelta
+
+NOTICE_KEY = ("notice", "latest")
+
+
+class Snapshot:
+    """크롤링 스냅샷 (값 + 수집 시각 + 버전)"""
+
+    __slots__ = ("value", "fetched_at", "version")
+
+    def __init__(self, value, fetched_at, version):
+        self.value = value
+        self.fetched_at = fetched_at
+        self.version = version
+
+    def age(self):
+        """수집 후 경과 시간 (초)"""
+        return time.time() - self.fetched_at
+
+
+class PrefetchScheduler:
+    """식단/공지사항 백그라운드 갱신 스케줄러
+
+    오늘~모레 식단(식단표는 2일 뒤까지만 공개)과 공지사항 첫 페이지들을
+    주기적으로 미리 가져와 스냅샷으로 보관한다.
+    공지 페이지 수는 요청 경로(refresh_notices 기본 5페이지)와 같게 맞춘다.
+    """
+
+    def __init__(self, knowledge_base, interval=600, menu_days=3, notice_pages=5):
+        self.knowledge_base = knowledge_base
+        self.interval = interval
+        self.menu_days = menu_days
+        self.notice_pages = notice_pages
+
+        self.snapshots = {}
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._ready = threading.Event()  # 첫 갱신 시도가 끝나면 set
+        self._thread = None
+
+        # 갱신 통계
+        self.last_refresh_at = None
+        self.last_refresh_duration = None
+        self.refresh_count = 0
+        self.error_count = 0
+
+    def menu_dates(self, today=None):
+        """미리 가져올 식단 날짜 목록 (YYYY.MM.DD)"""
+        today = today or date.today()
+        return [(today + timedelta(days=i)).strftime("%Y.%m.%d") for i in range(self.menu_days)]
+
+    def is_running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def is_ready(self):
+        """첫 갱신 시도가 끝났는지 (끝나기 전에는 스냅샷이 비어 있음)"""
+        return self._ready.is_set()
+
+    def start(self, wait=True, timeout=60):
+        """백그라운드 갱신 시작
+
+        wait=True면 첫 갱신이 끝날 때까지(최대 timeout초) 기다렸다가 반환해
+        서비스 시작 직후 질문도 스냅샷으로 답하게 한다.
+        """
+        if not self.is_running():
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name="campus-prefetch", daemon=True)
+            self._thread.start()
+            print(f"🔄 백그라운드 갱신 시작 (주기: {self.interval}초)")
+        if wait and not self._ready.wait(timeout):
+            print(f"⚠️ 첫 백그라운드 갱신이 {timeout}초 안에 끝나지 않아 먼저 시작합니다")
+
+    def stop(self, timeout=5):
+        """백그라운드 갱신 중지"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        print("⏹️ 백그라운드 갱신 중지")
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            try:
+                self.refresh_once()
+            except Exception as e:
+                self.error_count += 1
+                print(f"⚠️ 백그라운드 갱신 오류: {e}")
+            finally:
+                self._ready.set()
+            self._stop_event.wait(self.interval)
+
+    def refresh_once(self):
+        """식단/공지사항 스냅샷 1회 갱신"""
+        started = time.time()
+        kb = self.knowledge_base
+
+        for date_str in self.menu_dates():
+            menu = kb.fetch_today_menu(date_str)
+            if menu is not None:
+                self.put(("menu", date_str), menu)
+            else:
+                self.error_count += 1
+
+        notices = kb.refresh_notices(max_pages=self.notice_pages)
+        if notices and not any("message" in notice for notice in notices):
+            self.put(NOTICE_KEY, notices)
+        else:
+            self.error_count += 1
+
+        self.last_refresh_at = time.time()
+        self.last_refresh_duration = self.last_refresh_at - started
+        self.refresh_count += 1
+
+    def put(self, key, value):
+        """스냅샷 저장 (내용이 바뀐 경우에만 버전 증가)"""
+        with self._lock:
+            previous = self.snapshots.get(key)
+            if previous is not None and previous.value == value:
+                # 같은 객체를 유지해 값 기준 캐시(렌더링된 컨텍스트 등)가 그대로 재사용되게 함
+                value, version = previous.value, previous.version
+            else:
+                version = previous.version + 1 if previous is not None else 1
+            self.snapshots[key] = Snapshot(value, time.time(), version)
+
+    def get(self, key):
+        """스냅샷 조회 (없으면 None)"""
+        with self._lock:
+            return self.snapshots.get(key)
+
+    def covers(self, key):
+        """백그라운드 갱신 대상 키인지 확인"""
+        if key == NOTICE_KEY:
+            return True
+        return key[0] == "menu" and key[1] in self.menu_dates()
+
+    def lag(self):
+        """키별 스냅샷 경과 시간 (초)"""
+        with self._lock:
+            return {key: round(snapshot.age(), 1) for key, snapshot in self.snapshots.items()}
+
+    def stats(self):
+        """갱신 상태 및 지연 통계"""
+        lag = self.lag()
+        return {
+            "running": self.is_running(),
+            "ready": self.is_ready(),
+            "interval": self.interval,
+            "refresh_count": self.refresh_count,
+            "error_count": self.error_count,
+            "last_refresh_duration": self.last_refresh_duration,
+            "seconds_since_refresh": (time.time() - self.last_refresh_at) if self.last_refresh_at else None,
+            "max_lag": max(lag.values()) if lag else None,
+            "lag": lag
+        }
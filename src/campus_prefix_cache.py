@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import copy
+from functools import partial
+
+import torch
+
+# 레거시 튜플 캐시를 쓰는 구버전 transformers면 변환 없이 그대로 사용
+try:
+    from transformers import DynamicCache
+except ImportError:
+    DynamicCache = None
+
+
+class PrefixKVCache:
+    """고정된 시스템 프롬프트 앞부분의 KV 캐시를 모델 로드 시 한 번만 계산해 재사용
+
+    요청마다 캐시를 복사해 generate()에 넘기면 모델은 접두사 뒤 토큰(현재 시각,
+    컨텍스트, 질문)만 prefill한다. 접두사와 나머지는 따로 토큰화해 이어 붙이므로
+    캐시한 토큰 id와 실제 입력의 앞부분이 항상 같다. 컨텍스트도 ContextPacker가
+    캐시한 토큰 id를 받으면 다시 토큰화하지 않는다.
+    """
+
+    def __init__(self, model, tokenizer, prefix, device, enabled=True):
+        self.model = model
+        self.tokenizer = tokenizer
+        self.prefix = prefix
+        self.device = device
+        self.prefix_ids = tokenizer.encode(prefix, add_special_tokens=False)
+        self.past = None
+        self.enabled = enabled
+
+        # 통계
+        self.reused = 0
+        self.full_prefills = 0
+
+        if enabled:
+            self.build()
+
+    def build(self):
+        """접두사 KV 캐시 계산 (실패하면 캐시 없이 전체 prefill)"""
+        try:
+            input_ids = torch.tensor([self.prefix_ids], device=self.device)
+            with torch.no_grad():
+                outputs = self.model(input_ids=input_ids, use_cache=True)
+            past = outputs.past_key_values
+            if DynamicCache is not None and isinstance(past, tuple):
+                past = DynamicCache.from_legacy_cache(past)
+            self.past = past
+            print(f"🧠 시스템 프롬프트 KV 캐시 준비 완료 ({len(self.prefix_ids)} 토큰)")
+        except Exception as e:
+            print(f"⚠️ 시스템 프롬프트 KV 캐시 생성 실패, 매번 전체 prefill: {e}")
+            self.past = None
+            self.enabled = False
+
+    def count(self, suffix):
+        """접두사 + suffix 토큰 수"""
+        return len(self.prefix_ids) + len(self.tokenizer.encode(suffix, add_special_tokens=False))
+
+    def inputs(self, suffix, context=None, context_ids=None):
+        """접두사 토큰 id + suffix 토큰 id로 만든 generate() 입력
+
+        suffix 안의 context 부분은 context_ids(ContextPacker.pack_ids)를 그대로 쓰고
+        그 앞뒤(현재 시각, 질문, 채팅 태그)만 토큰화한다.
+        """
+        encode = partial(self.tokenizer.encode, add_special_tokens=False)
+        if context and context_ids is not None and context in suffix:
+            head, _, tail = suffix.partition(context)
+            ids = self.prefix_ids + encode(head) + list(context_ids) + encode(tail)
+        else:
+            ids = self.prefix_ids + encode(suffix)
+        input_ids = torch.tensor([ids], device=self.device)
+        return {"input_ids": input_ids, "attention_mask": torch.ones_like(input_ids)}
+
+    def past_for_request(self):
+        """요청용 캐시 사본 (generate가 캐시를 제자리에서 늘리므로 원본은 보존)"""
+        if not self.enabled or self.past is None:
+            return None
+        return copy.deepcopy(self.past)
+
+    def generate(self, inputs, **kwargs):
+        """접두사 캐시를 이어서 생성 (캐시가 없으면 일반 generate)"""
+        past = self.past_for_request()
+        if past is None:
+            self.full_prefills += 1
+            return self.model.generate(**inputs, **kwargs)
+        self.reused += 1
+        return self.model.generate(**inputs, past_key_values=past, **kwargs)
+
+    def stats(self):
+        return {
+            "enabled": self.enabled,
+            "prefix_tokens": len(self.prefix_ids),
+            "reused": self.reused,
+            "full_prefills": self.full_prefills,
+        }
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class CircuitOpenError(Exception):
+    """호스트 차단기가 열려 있어 요청을 보내지 않음"""
+
+
+class DeadlineExceeded(Exception):
+    """요청 전체 제한 시간 초과"""
+
+
+class CircuitBreaker:
+    """호스트별 차단기 (연속 실패 시 일정 시간 요청 차단)
+
+    closed: 정상 / open: 차단 / half_open: 시험 요청 1건 허용
+    """
+
+    def __init__(self, failure_threshold=3, reset_timeout=60):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = None
+        self.trip_count = 0
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """요청 허용 여부"""
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open" and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = "half_open"
+                self._trial_in_flight = False
+            if self.state == "half_open" and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = "closed"
+            self.failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._trial_in_flight = False
+            if self.state == "half_open" or self.failures >= self.failure_threshold:
+                if self.state != "open":
+                    self.trip_count += 1
+                self.state = "open"
+                self.opened_at = time.monotonic()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "state": self.state,
+                "failures": self.failures,
+                "trip_count": self.trip_count
+            }
+
+
+class Loaded:
+    """남은 TTL을 함께 돌려주는 로더 결과 (저장소에서 꺼낸, 이미 나이 든 스냅샷 등)"""
+
+    __slots__ = ("value", "ttl")
+
+    def __init__(self, value, ttl):
+        self.value = value
+        self.ttl = ttl
+
+
+class StaleWhileRevalidate:
+    """마지막 정상 스냅샷을 즉시 반환하고 뒤에서 갱신
+
+    신선한 값은 TTL 캐시에서, 만료된 값은 last_good에서 꺼낸다.
+    같은 키의 갱신은 동시에 하나만 실행된다.
+    """
+
+    def __init__(self, cache, max_workers=2):
+        self.cache = cache
+        self.last_good = {}
+        self._in_flight = set()
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="campus-swr")
+
+        # 통계
+        self.stale_served = 0
+        self.background_refreshes = 0
+        self.refresh_failures = 0
+
+    def get(self, key, loader, is_valid=None, load_missing=True):
+        """신선한 값 → 오래된 값(+백그라운드 갱신) → 동기 로드 순으로 조회
+
+        load_missing=False면 둘 다 없을 때 동기 로드 대신 None (호출자가 모아서 가져옴)
+        """
+        value = self.cache.get(key)
+        if value is not None:
+            return value
+
+        with self._lock:
+            stale = self.last_good.get(key)
+
+        if stale is not None:
+            self.stale_served += 1
+            self._refresh_async(key, loader, is_valid)
+            return stale
+
+        if not load_missing:
+            return None
+        return self._load(key, loader, is_valid)
+
+    def put(self, key, value, ttl=None):
+        """밖에서 가져온 정상 값을 신선한 값과 마지막 정상 스냅샷으로 저장 (ttl 없으면 캐시 기본값)"""
+        self.cache.set(key, value, ttl)
+        with self._lock:
+            self.last_good[key] = value
+
+    def _load(self, key, loader, is_valid):
+        value, ttl = loader(), None
+        if isinstance(value, Loaded):
+            # 저장소 스냅샷처럼 이미 나이 든 값은 남은 TTL만큼만 신선한 값으로 보관
+            value, ttl = value.value, value.ttl
+        if value is None or (is_valid is not None and not is_valid(value)):
+            self.refresh_failures += 1
+            return value
+
+        self.cache.set(key, value, ttl)
+        with self._lock:
+            self.last_good[key] = value
+        return value
+
+    def _refresh_async(self, key, loader, is_valid):
+        with self._lock:
+            if key in self._in_flight:
+                return
+            self._in_flight.add(key)
+
+        def refresh():
+            try:
+                self.background_refreshes += 1
+                self._load(key, loader, is_valid)
+            except Exception as e:
+                self.refresh_failures += 1
+                print(f"⚠️ 백그라운드 재검증 실패 {key}: {e}")
+            finally:
+                with self._lock:
+                    self._in_flight.discard(key)
+
+        self._executor.submit(refresh)
+
+    def stats(self):
+        return {
+            "stale_keys": len(self.last_good),
+            "stale_served": self.stale_served,
+            "background_refreshes": self.background_refreshes,
+            "refresh_failures": self.refresh_failures
+        }
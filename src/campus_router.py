@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import re
+
+# 의도별 키워드 (질문은 소문자로 변환 후 비교)
+INTENT_KEYWORDS = {
+    "graduation": ['졸업', '학점', '전공', '교양', '요건', '논문'],
+    "notice": ['공지', '장학금', '신청', '안내', '소식', '행사'],
+    "academic_schedule": ['수강신청', '수강', '신청', '시험', '개강', '종강', '일정', '언제', '학사', '방학', '계절학기'],
+    "dining": ['식단', '학식', '메뉴', '식당', '밥', '점심', '저녁', '아침', '1학', '2학', '3학', '긱사', '기숙'],
+    "dining_week": ['이번 주', '이번주', '주간', '일주일'],
+    "dining_all_cafeterias": ['긱사', '기숙', '3학', '1학'],
+    "shuttle": ['셔틀', '버스', '교통', '시간표', '운행', '통학', '대전역', '유성'],
+
+    # 날짜 표현
+    "date_yesterday": ['어제', 'yesterday'],
+    "date_today": ['오늘', 'today', '지금'],
+    "date_tomorrow": ['내일', 'tomorrow'],
+    "date_day_after_tomorrow": ['모레'],
+    "weekday": ['월요일', '화요일', '수요일', '목요일', '금요일', '토요일', '일요일'],
+
+    # 모델 없이 답하는 fallback용 (좁은 키워드)
+    "fallback_shuttle": ['셔틀', '버스'],
+    "fallback_graduation": ['졸업', '학점'],
+    "fallback_menu": ['식단', '메뉴'],
+}
+
+WEEKDAYS = INTENT_KEYWORDS["weekday"]
+
+# README 질문 유형 번호 순서 (분류기 출력 순서와 같음)
+LABELS = ["graduation", "notice", "academic_schedule", "dining", "shuttle"]
+
+
+class RouteResult:
+    """라우팅 결과 (의도 -> [(시작, 끝, 키워드), ...])"""
+
+    __slots__ = ("text", "matches")
+
+    def __init__(self, text, matches):
+        self.text = text
+        self.matches = matches
+
+    def has(self, *intents):
+        """의도 중 하나라도 매칭됐는지"""
+        return any(intent in self.matches for intent in intents)
+
+    def spans(self, intent):
+        return self.matches.get(intent, [])
+
+    def keywords(self, intent):
+        """매칭된 키워드 (등장 순서, 중복 제거)"""
+        return list(dict.fromkeys(keyword for _, _, keyword in self.spans(intent)))
+
+    @property
+    def intents(self):
+        return list(self.matches)
+
+    def __repr__(self):
+        return f"RouteResult({self.matches})"
+
+
+class IntentRouter:
+    """모든 의도 키워드를 하나의 정규식으로 묶어 한 번에 매칭
+
+    전방탐색 (?=(...)) 으로 위치마다 가장 긴 키워드를 찾고, 그 키워드의
+    접두사인 키워드들도 함께 매칭된 것으로 본다. 따라서 '수강신청' 안의
+    '수강'·'신청'처럼 겹치는 키워드도 기존 `in` 검사와 똑같이 모두 잡힌다.
+    """
+
+    def __init__(self, intent_keywords=None):
+        self.intent_keywords = intent_keywords or INTENT_KEYWORDS
+
+        # 키워드 -> 의도 목록
+        keyword_intents = {}
+        for intent, keywords in self.intent_keywords.items():
+            for keyword in keywords:
+                keyword_intents.setdefault(keyword.lower(), []).append(intent)
+
+        # 키워드 -> 자기 자신을 포함한 접두사 키워드들
+        self._closure = {
+            keyword: [prefix for prefix in keyword_intents if keyword.startswith(prefix)]
+            for keyword in keyword_intents
+        }
+        self._keyword_intents = keyword_intents
+
+        alternation = "|".join(re.escape(k) for k in sorted(keyword_intents, key=len, reverse=True))
+        self.pattern = re.compile(f"(?=({alternation}))")
+
+    def route(self, text):
+        """질문 한 번 훑어서 매칭된 모든 의도와 위치 반환"""
+        lowered = text.lower()
+        matches = {}
+        for match in self.pattern.finditer(lowered):
+            start = match.start()
+            for keyword in self._closure[match.group(1)]:
+                span = (start, start + len(keyword), keyword)
+                for intent in self._keyword_intents[keyword]:
+                    matches.setdefault(intent, []).append(span)
+        return RouteResult(text, matches)
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import copy
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit, urlunsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Timeout
+
+from campus_cache import TTLCache
+from campus_resilience import CircuitBreaker, CircuitOpenError, DeadlineExceeded
+
+# brotli가 설치되어 있으면 br 압축도 요청 (urllib3가 자동 해제)
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+DEFAULT_TIMEOUT = 5  # 요청당 전체 제한 시간 (초)
+DEFAULT_MAX_WORKERS = 4  # 동시 요청 상한
+USER_AGENT = "Mozilla/5.0 (compatible; CNU-Campus-ChatBot)"
+VALIDATOR_TTL = 86400  # ETag/Last-Modified + 파싱 결과 보관 시간 (초)
+
+
+def create_session(pool_maxsize=DEFAULT_MAX_WORKERS):
+    """keep-alive 연결을 재사용하는 공유 세션 생성"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"User-Agent": USER_AGENT, "Accept-Encoding": ACCEPT_ENCODING})
+    return session
+
+
+def rebase_url(url, base_url):
+    """URL의 scheme/host를 base_url 것으로 교체 (경로와 쿼리는 유지)
+
+    예: rebase_url("https://plus.cnu.ac.kr/_prog/_board/", "http://127.0.0.1:8765")
+        -> "http://127.0.0.1:8765/_prog/_board/"
+    """
+    base = urlsplit(base_url)
+    parts = urlsplit(url)
+    path = base.path.rstrip("/") + parts.path
+    return urlunsplit((base.scheme, base.netloc, path, parts.query, parts.fragment))
+
+
+class CampusHttpClient:
+    """학교 사이트 크롤링용 HTTP 클라이언트 (세션 풀 + 동시 요청)"""
+
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS, timeout=DEFAULT_TIMEOUT,
+                 failure_threshold=3, reset_timeout=60):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.session = create_session(pool_maxsize=max_workers)
+
+        # 호스트별 차단기
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.breakers = {}
+
+        # 조건부 요청용 URL별 검증자 + 파싱 결과 (etag, last_modified, parsed)
+        self.validators = TTLCache(maxsize=256, ttl=VALIDATOR_TTL)
+        self.not_modified = 0
+        self.bytes_received = 0
+
+    def breaker_for(self, url):
+        """URL 호스트의 차단기 (없으면 생성)"""
+        host = urlsplit(url).netloc
+        breaker = self.breakers.get(host)
+        if breaker is None:
+            breaker = self.breakers.setdefault(
+                host, CircuitBreaker(self.failure_threshold, self.reset_timeout)
+            )
+        return breaker
+
+    def get(self, url, params=None, timeout=None, headers=None):
+        """단일 GET 요청 (utf-8 디코딩)
+
+        timeout은 연결~본문 수신까지 전체에 대한 제한 시간이다.
+        연결/헤더 대기는 urllib3 Timeout(total)로 남은 시간만큼만, 본문은 청크마다
+        소켓 제한 시간을 남은 시간으로 줄여서 읽는다.
+        """
+        breaker = self.breaker_for(url)
+        if not breaker.allow():
+            raise CircuitOpenError(f"{urlsplit(url).netloc} 차단 중 (연속 실패)")
+
+        budget = self.timeout if timeout is None else timeout
+        deadline = time.monotonic() + budget
+        response = None
+        try:
+            response = self.session.get(url, params=params, timeout=Timeout(total=budget), stream=True,
+                                        headers=headers)
+            response.raise_for_status()
+            response._content = self._read_body(response, deadline)
+        except Exception:
+            breaker.record_failure()
+            if response is not None:
+                response.close()
+            raise
+
+        breaker.record_success()
+        self.bytes_received += self._wire_bytes(response)
+        response.encoding = "utf-8"
+        return response
+
+    @staticmethod
+    def _wire_bytes(response):
+        """압축 해제 전 실제로 받은 본문 바이트 (urllib3 tell → Content-Length → 본문 길이 순)"""
+        try:
+            return int(response.raw.tell())
+        except (AttributeError, TypeError, ValueError):
+            pass
+        length = response.headers.get("Content-Length", "")
+        return int(length) if length.isdigit() else len(response._content)
+
+    @staticmethod
+    def validator_key(url, params=None):
+        """조건부 요청 캐시 키 (파라미터 순서 무관)"""
+        return (url, tuple(sorted((k, str(v)) for k, v in (params or {}).items())))
+
+    def get_parsed(self, url, params, parse, timeout=None):
+        """ETag/Last-Modified 조건부 GET 후 파싱 결과 반환
+
+        304 응답이면 본문을 받지 않고 이전 파싱 결과의 사본을 돌려준다
+        (보관한 원본은 호출자가 고쳐도 바뀌지 않음).
+        한 URL(+파라미터)에는 항상 같은 parse 함수를 쓴다고 가정한다.
+        """
+        key = self.validator_key(url, params)
+        cached = self.validators.get(key)
+        headers = {}
+        if cached is not None:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        response = self.get(url, params=params, timeout=timeout, headers=headers or None)
+        if response.status_code == 304 and cached is not None:
+            self.not_modified += 1
+            # 다시 확인된 항목은 보관 시간 연장
+            self.validators.set(key, cached)
+            return copy.deepcopy(cached[2])
+
+        parsed = parse(response)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if parsed is not None and (etag or last_modified):
+            self.validators.set(key, (etag, last_modified, copy.deepcopy(parsed)))
+        return parsed
+
+    @staticmethod
+    def _body_socket(response):
+        """본문을 읽는 소켓 (urllib3 내부 구조가 달라 찾지 못하면 None)"""
+        connection = getattr(response.raw, "_connection", None)
+        return getattr(connection, "sock", None)
+
+    @classmethod
+    def _read_body(cls, response, deadline):
+        """본문을 읽으면서 전체 제한 시간 확인
+
+        소켓 읽기 하나가 남은 시간보다 오래 막히지 않도록 청크마다 소켓 제한 시간을 줄인다.
+        """
+        chunks = []
+        sock = cls._body_socket(response)
+        body = response.iter_content(chunk_size=4096)
+        try:
+            while True:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise DeadlineExceeded(f"응답 수신 제한 시간 초과: {response.url}")
+                if sock is not None:
+                    sock.settimeout(remaining)
+                try:
+                    chunk = next(body)
+                except StopIteration:
+                    break
+                except requests.exceptions.RequestException as e:
+                    if time.monotonic() >= deadline:
+                        raise DeadlineExceeded(f"응답 수신 제한 시간 초과: {response.url}") from e
+                    raise
+                chunks.append(chunk)
+        finally:
+            response.close()
+        return b"".join(chunks)
+
+    def fetch_many(self, jobs, parse, max_workers=None):
+        """여러 요청을 동시에 실행하고 입력 순서대로 결과 반환
+
+        jobs: [(url, params), ...]
+        parse: response -> 결과 (워커 스레드에서 실행, 304면 이전 결과 재사용)
+        실패한 요청은 해당 위치에 예외 객체가 들어감
+        """
+        if not jobs:
+            return []
+
+        def run(job):
+            url, params = job
+            try:
+                return self.get_parsed(url, params, parse)
+            except Exception as e:
+                return e
+
+        workers = max(1, min(max_workers or self.max_workers, len(jobs)))
+        if workers == 1:
+            return [run(job) for job in jobs]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(run, jobs))
+
+    def stats(self):
+        """호스트별 차단기 상태"""
+        return {host: breaker.stats() for host, breaker in self.breakers.items()}
+
+    def transfer_stats(self):
+        """조건부 요청/수신량 통계"""
+        return {
+            "not_modified": self.not_modified,
+            "bytes_received": self.bytes_received,  # 압축된 전송 바이트
+            "validators": len(self.validators)
+        }
+
+    def close(self):
+        self.session.close()
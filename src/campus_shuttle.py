@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import re
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime, timedelta
+
+from campus_dates import DateParser
+
+WEEKDAY_NAMES = ['월', '화', '수', '목', '금', '토', '일']
+
+# 운행 기간(2025. 3. 4. ~ 12. 19.) 안의 공휴일·대체공휴일 (shuttle.non_operation)
+HOLIDAYS = {
+    date(2025, 5, 5): "어린이날·부처님오신날",
+    date(2025, 5, 6): "대체공휴일",
+    date(2025, 6, 3): "대통령선거일",
+    date(2025, 6, 6): "현충일",
+    date(2025, 8, 15): "광복절",
+    date(2025, 10, 3): "개천절",
+    date(2025, 10, 6): "추석 연휴",
+    date(2025, 10, 7): "추석 연휴",
+    date(2025, 10, 8): "대체공휴일",
+    date(2025, 10, 9): "한글날",
+    date(2025, 12, 25): "성탄절",
+}
+# 이 시각(분) 이전 출발편만 미운행하는 날
+PARTIAL_HOLIDAYS = {
+    date(2025, 11, 13): ("수학능력시험일", 10 * 60),
+}
+
+ROUTE_NAMES = {"campus_internal": "교내 순환", "campus_circulation": "캠퍼스 순환(대덕→보운)"}
+
+# 템플릿별 질문 표현 (어느 템플릿에도 해당하지 않으면 None → 모델이 답함)
+FIRST_CUES = re.compile(r"첫차|처음|첫\s*(?:셔틀|버스|운행|차)")
+LAST_CUES = re.compile(r"막차|마지막|몇\s*시(?:에)?\s*끝나")
+PREVIOUS_CUES = re.compile(r"놓쳤|방금|이전|지났")
+TIMETABLE_CUES = re.compile(r"시간표")
+NEXT_CUES = re.compile(r"다음\s*(?:셔틀|버스|차|거|편|운행)|(?:언제|몇\s*시(?:에)?)\s*(?:와|오|출발|있|타|떠)"
+                       r"|남았|곧|이번\s*(?:셔틀|버스|차)")
+SERVICE_CUES = re.compile(r"운행\s*(?:해|하나|하니|하는지|돼|되나|되니|되는지|중)")
+
+# 시간표 계산으로 답하면 안 되는 질문: 노선/정류장, 운행 기간, 휴일, 요금, 운행 종료 시기 등
+HOLIDAY_WORDS = ["공휴일", "휴일", "연휴", "명절", "어린이날", "부처님", "석가", "선거", "현충일", "광복절",
+                 "개천절", "추석", "설날", "한글날", "성탄", "크리스마스", "수능"]
+OTHER_CUES = re.compile(r"노선|정류장|어디|경로|위치|타는\s*곳|몇\s*대|몇\s*인승|문의|연락"
+                        r"|기간|(?<!셔틀)(?<!버스)(?<!차)(?:까지|부터)|학기|방학|요금|가격|얼마(?!\s*나)|무료"
+                        r"|언제\s*끝나|끝내|종료|" + "|".join(HOLIDAY_WORDS))
+CIRCULATION_CUES = re.compile(r"보운|캠퍼스\s*순환|월평|골프")
+PERIOD_DATE = re.compile(r"(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})\.")
+CLOCK = re.compile(r"(\d{1,2}):(\d{2})")
+
+
+def to_minutes(clock):
+    match = CLOCK.search(clock)
+    return int(match.group(1)) * 60 + int(match.group(2))
+
+
+def format_clock(minutes):
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+
+def format_day(day):
+    return f"{day.month}월 {day.day}일({WEEKDAY_NAMES[day.weekday()]})"
+
+
+class ShuttleSchedule:
+    """셔틀 시간표 엔진 (출발 시각을 분 단위 정렬 배열로 두고 bisect로 조회)
+
+    운행일: 운행 기간 안 + 학기 중 + 평일 + 공휴일 아님
+    """
+
+    def __init__(self, shuttle, academic_schedule=None, holidays=None, partial_holidays=None):
+        self.shuttle = shuttle
+        self.holidays = HOLIDAYS if holidays is None else holidays
+        self.partial_holidays = PARTIAL_HOLIDAYS if partial_holidays is None else partial_holidays
+
+        period = [date(*map(int, found)) for found in PERIOD_DATE.findall(shuttle["operation_overview"]["period"])]
+        self.period = (period[0], period[-1])
+
+        # 방학에는 운행하지 않으므로 학기 기간과 겹치는 날만 운행
+        self.semesters = []
+        parser = DateParser()
+        for semester in (academic_schedule or {}).values():
+            if isinstance(semester, dict) and "period" in semester:
+                found = parser.parse_all(semester["period"])
+                if found:
+                    self.semesters.append((found[0].start, found[-1].end))
+
+        internal = shuttle["campus_internal"]
+        circulation = shuttle["campus_circulation"]
+        self.departures = {
+            "campus_internal": sorted(to_minutes(clock) for clock in internal["schedule"]),
+            "campus_circulation": [to_minutes(circulation["departure"])],
+        }
+        self.origins = {
+            "campus_internal": internal["route_stops"][0],
+            "campus_circulation": circulation["departure"].split("(", 1)[1].rstrip(")"),
+        }
+        self.date_parser = parser
+
+    def closed_reason(self, day):
+        """운행하지 않는 날이면 사유, 운행일이면 None"""
+        if not self.period[0] <= day <= self.period[1]:
+            return "운행 기간 외"
+        if self.semesters and not any(start <= day <= end for start, end in self.semesters):
+            return "방학"
+        if day.weekday() >= 5:
+            return "주말"
+        return self.holidays.get(day)
+
+    def times_on(self, day, route="campus_internal"):
+        """day에 실제 운행하는 출발 시각(분) 목록"""
+        if self.closed_reason(day):
+            return []
+        times = self.departures[route]
+        if day in self.partial_holidays:
+            return times[bisect_left(times, self.partial_holidays[day][1]):]
+        return times
+
+    def next_departure(self, now, route="campus_internal", max_days=200):
+        """now 이후 첫 출발 (datetime, 없으면 None)"""
+        day, minute = now.date(), now.hour * 60 + now.minute
+        for offset in range(max_days):
+            times = self.times_on(day, route)
+            i = bisect_left(times, minute) if offset == 0 else 0
+            if i < len(times):
+                return datetime.combine(day, datetime.min.time()) + timedelta(minutes=times[i])
+            day += timedelta(days=1)
+            if day > self.period[1]:
+                return None
+        return None
+
+    def previous_departure(self, now, route="campus_internal"):
+        """오늘 now 이전 마지막 출발 (datetime, 없으면 None)"""
+        times = self.times_on(now.date(), route)
+        i = bisect_right(times, now.hour * 60 + now.minute)
+        if i == 0:
+            return None
+        return datetime.combine(now.date(), datetime.min.time()) + timedelta(minutes=times[i - 1])
+
+    def answer(self, question, now=None):
+        """시간 관련 셔틀 질문에 대한 템플릿 답변 (시간표로 답할 수 없는 질문이면 None)
+
+        템플릿: 첫차 / 막차 / 방금 떠난 차 / 날짜별 시간표 / 다음 차 / 운행 여부
+        """
+        if OTHER_CUES.search(question):
+            return None
+        first, last = FIRST_CUES.search(question), LAST_CUES.search(question)
+        previous, timetable = PREVIOUS_CUES.search(question), TIMETABLE_CUES.search(question)
+        if not (first or last or previous or timetable
+                or NEXT_CUES.search(question) or SERVICE_CUES.search(question)):
+            return None
+        now = now or datetime.now()
+        asked = self.date_parser.parse(question, now.date())
+        if asked is not None and asked.is_range:
+            return None
+
+        route = "campus_circulation" if CIRCULATION_CUES.search(question) else "campus_internal"
+        name = ROUTE_NAMES[route]
+        origin = self.origins[route]
+        note = self.shuttle["important_notes"][0]
+        day = asked.start if asked is not None else now.date()
+        start = now if day == now.date() else datetime.combine(day, datetime.min.time())
+
+        reason = self.closed_reason(day)
+        if reason:
+            upcoming = self.next_departure(start, route)
+            after = f" 다음 운행은 {format_day(upcoming.date())} {upcoming:%H:%M}입니다." if upcoming else ""
+            return f"{format_day(day)}은 {name} 셔틀버스 미운행일입니다 ({reason}).{after}"
+
+        times = self.times_on(day, route)
+        if first:
+            return f"{format_day(day)} {name} 셔틀 첫차는 {format_clock(times[0])} {origin} 출발입니다. ({note})"
+        if last:
+            return f"{format_day(day)} {name} 셔틀 막차는 {format_clock(times[-1])} {origin} 출발입니다. ({note})"
+        if timetable or day != now.date():
+            return f"{format_day(day)} {name} 셔틀 시간표({origin} 출발): {', '.join(format_clock(t) for t in times)}"
+
+        upcoming = self.next_departure(now, route)
+        last_departure = self.previous_departure(now, route)
+        prefix = ""
+        if previous and last_departure is not None:
+            prefix = f"가장 최근 {name} 셔틀은 {last_departure:%H:%M}에 출발했습니다. "
+        if upcoming is None:
+            return prefix + f"올해 남은 {name} 셔틀 운행이 없습니다."
+        if upcoming.date() != now.date():
+            return prefix + (f"오늘 {name} 셔틀 운행은 끝났습니다. "
+                             f"다음 운행은 {format_day(upcoming.date())} {upcoming:%H:%M} {origin} 출발입니다.")
+
+        wait = int((upcoming - now).total_seconds() // 60)
+        upcoming_minute = upcoming.hour * 60 + upcoming.minute
+        later = [format_clock(t) for t in times[bisect_right(times, upcoming_minute):][:2]]
+        after = f" 그다음은 {', '.join(later)}입니다." if later else " 오늘 막차입니다."
+        return prefix + f"다음 {name} 셔틀은 {upcoming:%H:%M} {origin} 출발입니다 ({wait}분 후).{after} ({note})"
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+import json
+import os
+import sqlite3
+import time
+from contextlib import closing
+
+from campus_cache import cache_path
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS menu_days (
+    date TEXT PRIMARY KEY,
+    source TEXT,
+    fetched_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS menu_rows (
+    date TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    meal_type TEXT,
+    target TEXT,
+    cafeteria TEXT,
+    menu TEXT,
+    PRIMARY KEY (date, seq)
+);
+CREATE INDEX IF NOT EXISTS idx_menu_rows_date ON menu_rows(date);
+CREATE INDEX IF NOT EXISTS idx_menu_rows_cafeteria ON menu_rows(cafeteria, date);
+CREATE TABLE IF NOT EXISTS notices (
+    notice_key TEXT PRIMARY KEY,
+    title TEXT,
+    writer TEXT,
+    date TEXT,
+    seq INTEGER NOT NULL,
+    fetched_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_notices_date ON notices(date);
+CREATE INDEX IF NOT EXISTS idx_notices_seq ON notices(seq);
+CREATE TABLE IF NOT EXISTS snapshot_meta (
+    name TEXT PRIMARY KEY,
+    fetched_at REAL NOT NULL
+);
+"""
+
+
+class CampusSnapshotDB:
+    """크롤링한 식단/공지사항을 보관하는 SQLite 저장소
+
+    재시작하거나 여러 워커 프로세스가 떠 있어도 같은 데이터를 공유한다.
+    공지는 seq가 작을수록 최근에 추가된 것이며, 저장할 때 오래된 공지부터 정리한다.
+    """
+
+    def __init__(self, path=None):
+        path = path or cache_path("campus_snapshot.db")
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+            conn.commit()
+
+    def _connect(self):
+        # 호출마다 새 연결 (스레드/프로세스 간 공유 안전)
+        return sqlite3.connect(self.path, timeout=5)
+
+    def save_menu(self, result):
+        """식단 결과(fetch_today_menu 반환값) 저장"""
+        day = result["date"]
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM menu_rows WHERE date = ?", (day,))
+            conn.executemany(
+                "INSERT INTO menu_rows (date, seq, meal_type, target, cafeteria, menu) VALUES (?, ?, ?, ?, ?, ?)",
+                [(day, seq, meal["meal_type"], meal["target"], meal["cafeteria"],
+                  json.dumps(meal["menu"], ensure_ascii=False))
+                 for seq, meal in enumerate(result.get("meals", []))]
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO menu_days (date, source, fetched_at) VALUES (?, ?, ?)",
+                (day, result.get("source"), time.time())
+            )
+
+    def load_menu(self, day, max_age=None):
+        """저장된 식단 결과 복원 (day: YYYY-MM-DD, 너무 오래됐으면 None)"""
+        snapshot = self.menu_snapshot(day, max_age)
+        return snapshot[0] if snapshot is not None else None
+
+    def menu_snapshot(self, day, max_age=None):
+        """(식단 결과, 수집 시각) 또는 None (한 번 읽어 신선도까지 판단할 때)"""
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT source, fetched_at FROM menu_days WHERE date = ?", (day,)
+            ).fetchone()
+            if row is None:
+                return None
+            source, fetched_at = row
+            if max_age is not None and time.time() - fetched_at > max_age:
+                return None
+
+            rows = conn.execute(
+                "SELECT meal_type, target, cafeteria, menu FROM menu_rows WHERE date = ? ORDER BY seq", (day,)
+            ).fetchall()
+
+        meals = [{"meal_type": meal_type, "target": target, "cafeteria": cafeteria, "menu": json.loads(menu)}
+                 for meal_type, target, cafeteria, menu in rows]
+        return {
+            "status": "success",
+            "date": day,
+            "meals": meals,
+            "total_cafeterias": len(meals),
+            "source": source
+        }, fetched_at
+
+    def menu_dates(self, since=None):
+        """저장된 식단 날짜 목록 (since 이후)"""
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT date FROM menu_days WHERE date >= ? ORDER BY date", (since or "",)
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def save_notices(self, notices, key_func, keep=None):
+        """새 공지를 최신 쪽에 추가하고 keep개만 남김 (이미 있는 키는 그대로, 목록 순서 유지)
+
+        공지가 없어도 수집 시각은 갱신한다 (다른 워커가 신선한 목록으로 보도록).
+        """
+        now = time.time()
+        with closing(self._connect()) as conn, conn:
+            # 기존 행을 고치지 않고 현재 최소 seq 앞쪽 번호를 새로 배정
+            first = conn.execute("SELECT COALESCE(MIN(seq), 0) FROM notices").fetchone()[0]
+            conn.executemany(
+                "INSERT OR IGNORE INTO notices (notice_key, title, writer, date, seq, fetched_at) VALUES (?, ?, ?, ?, ?, ?)",
+                [(key_func(notice), notice.get("title"), notice.get("writer"), notice.get("date"),
+                  first - len(notices) + i, now)
+                 for i, notice in enumerate(notices)]
+            )
+            if keep is not None:
+                conn.execute(
+                    "DELETE FROM notices WHERE notice_key NOT IN (SELECT notice_key FROM notices ORDER BY seq LIMIT ?)",
+                    (keep,)
+                )
+            conn.execute(
+                "INSERT OR REPLACE INTO snapshot_meta (name, fetched_at) VALUES ('notices', ?)", (now,)
+            )
+
+    def known_notice_keys(self, keys):
+        """keys 중 이미 저장된 공지 키"""
+        keys = list(keys)
+        if not keys:
+            return set()
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                f"SELECT notice_key FROM notices WHERE notice_key IN ({', '.join('?' * len(keys))})", keys
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def count_notices(self):
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT COUNT(*) FROM notices").fetchone()[0]
+
+    def load_notices(self, limit=50, max_age=None):
+        """저장된 공지 목록 (최신순, 너무 오래됐으면 None)"""
+        snapshot = self.notices_snapshot(limit, max_age)
+        return snapshot[0] if snapshot is not None else None
+
+    def notices_snapshot(self, limit=50, max_age=None):
+        """(공지 목록, 수집 시각) 또는 None"""
+        with closing(self._connect()) as conn:
+            meta = conn.execute("SELECT fetched_at FROM snapshot_meta WHERE name = 'notices'").fetchone()
+            if meta is None:
+                return None
+            if max_age is not None and time.time() - meta[0] > max_age:
+                return None
+            rows = conn.execute(
+                "SELECT title, writer, date FROM notices ORDER BY seq LIMIT ?", (limit,)
+            ).fetchall()
+        return [{"title": title, "writer": writer, "date": day} for title, writer, day in rows], meta[0]
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""경량 질문 분류기 (문자 n-gram TF-IDF + 선형 softmax)
+
+train.json으로 직접 학습하거나, QClassifier 확률(soft label)을 섞어 증류한다.
+외부 라이브러리 없이 학습/추론하며 gzip JSON 한 파일로 저장된다.
+
+학습: cd src && python campus_tiny_classifier.py train --output ../checkpoints/tiny_router.json.gz [--teacher ../checkpoints/qclassifier]
+비교: cd src && python campus_tiny_classifier.py report --model ../checkpoints/tiny_router.json.gz [--teacher ...] [--onnx ...]
+"""
+import argparse
+import gzip
+import json
+import math
+import os
+import random
+import time
+from collections import Counter
+
+from campus_router import LABELS, IntentRouter
+
+TRAIN_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data", "train.json")
+
+
+def char_ngrams(text, ngram_range=(1, 3)):
+    """단어 경계를 포함한 문자 n-gram (scikit-learn char_wb와 같은 방식)"""
+    min_n, max_n = ngram_range
+    ngrams = []
+    for word in text.lower().split():
+        word = f" {word} "
+        for n in range(min_n, max_n + 1):
+            ngrams.extend(word[i:i + n] for i in range(max(1, len(word) - n + 1)))
+            if len(word) <= n:  # 짧은 단어는 한 번만
+                break
+    return ngrams
+
+
+def softmax(logits):
+    top = max(logits)
+    exp = [math.exp(value - top) for value in logits]
+    total = sum(exp)
+    return [value / total for value in exp]
+
+
+class TinyClassifier:
+    """문자 n-gram TF-IDF(1+log tf, L2 정규화) 위의 선형 분류기
+
+    features: n-gram -> [idf, w_0, ..., w_4]
+    """
+
+    def __init__(self, features, bias, ngram_range=(1, 3), labels=None):
+        self.features = features
+        self.bias = bias
+        self.ngram_range = tuple(ngram_range)
+        self.labels = labels or LABELS
+
+    def vectorize(self, text):
+        """희소 TF-IDF 벡터 {n-gram: 값} (학습 어휘에 없는 n-gram은 제외)"""
+        counts = Counter(gram for gram in char_ngrams(text, self.ngram_range) if gram in self.features)
+        vector = {gram: (1 + math.log(count)) * self.features[gram][0] for gram, count in counts.items()}
+        norm = math.sqrt(sum(value * value for value in vector.values())) or 1.0
+        return {gram: value / norm for gram, value in vector.items()}
+
+    def logits(self, vector):
+        scores = list(self.bias)
+        for gram, value in vector.items():
+            weights = self.features[gram]
+            for c in range(len(scores)):
+                scores[c] += value * weights[c + 1]
+        return scores
+
+    def predict(self, questions, batch_size=None):
+        """질문 목록 -> 유형별 확률 [[p0, ..., p4], ...] (LABELS 순서)"""
+        return [softmax(self.logits(self.vectorize(question))) for question in questions]
+
+    def predict_labels(self, questions, batch_size=None):
+        return [max(range(len(p)), key=p.__getitem__) for p in self.predict(questions)]
+
+    def save(self, path, precision=4, min_weight=1e-3):
+        """gzip JSON으로 저장 (모든 가중치가 작은 n-gram은 생략)"""
+        features = {
+            gram: [round(values[0], precision)] + [round(w, precision) for w in values[1:]]
+            for gram, values in self.features.items()
+            if max(abs(w) for w in values[1:]) >= min_weight
+        }
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump({"labels": self.labels, "ngram_range": list(self.ngram_range),
+                       "bias": [round(b, precision) for b in self.bias], "features": features},
+                      f, ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path):
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            data = json.load(f)
+        if data["labels"] != LABELS:
+            raise ValueError(f"레이블 순서가 다른 모델입니다: {data['labels']}")
+        return cls(data["features"], data["bias"], data["ngram_range"], data["labels"])
+
+    @classmethod
+    def fit(cls, questions, targets, ngram_range=(1, 3), epochs=40, lr=0.5, l2=1e-4, seed=42):
+        """softmax 회귀 SGD 학습
+
+        targets: 질문별 확률 분포 (정답 one-hot 또는 teacher soft label)
+        """
+        docs = [Counter(char_ngrams(question, ngram_range)) for question in questions]
+        df = Counter(gram for doc in docs for gram in doc)
+        n = len(docs)
+        num_classes = len(targets[0])
+        features = {gram: [math.log((1 + n) / (1 + count)) + 1] + [0.0] * num_classes
+                    for gram, count in df.items()}
+        model = cls(features, [0.0] * num_classes, ngram_range)
+        vectors = [model.vectorize(question) for question in questions]
+
+        rng = random.Random(seed)
+        order = list(range(n))
+        for epoch in range(epochs):
+            rng.shuffle(order)
+            step = lr / (1 + epoch * 0.1)
+            for i in order:
+                probs = softmax(model.logits(vectors[i]))
+                grad = [p - t for p, t in zip(probs, targets[i])]
+                for c in range(num_classes):
+                    model.bias[c] -= step * grad[c]
+                for gram, value in vectors[i].items():
+                    weights = features[gram]
+                    for c in range(num_classes):
+                        weights[c + 1] -= step * (grad[c] * value + l2 * weights[c + 1])
+        return model
+
+
+def keyword_label(route):
+    """키워드 라우팅의 단일 유형 (매칭 수가 가장 많은 유형, 같으면 먼저 나온 유형)"""
+    best, best_key = None, None
+    for c, label in enumerate(LABELS):
+        spans = route.spans(label)
+        if spans:
+            key = (-len(spans), spans[0][0])
+            if best_key is None or key < best_key:
+                best, best_key = c, key
+    return best
+
+
+def split_data(path=TRAIN_FILE, test_size=0.2, seed=42):
+    """노트북과 같은 80/20 층화 분할 (train, val)"""
+    from sklearn.model_selection import train_test_split
+
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return train_test_split(data, test_size=test_size, stratify=[x["label"] for x in data], random_state=seed)
+
+
+def train(output, teacher=None, alpha=0.5, epochs=40):
+    """train.json(또는 teacher 증류)으로 학습 후 저장"""
+    train_data, val_data = split_data()
+    questions = [x["question"] for x in train_data]
+    targets = [[1.0 if c == x["label"] else 0.0 for c in range(len(LABELS))] for x in train_data]
+
+    if teacher:
+        # 정답 one-hot과 teacher 확률을 섞은 soft label로 증류
+        from campus_classifier_onnx import load_runtime_classifier
+        teacher_probs = load_runtime_classifier(teacher).predict(questions)
+        targets = [[alpha * t + (1 - alpha) * p for t, p in zip(target, probs)]
+                   for target, probs in zip(targets, teacher_probs)]
+
+    started = time.perf_counter()
+    model = TinyClassifier.fit(questions, targets, epochs=epochs)
+    print(f"🏋️ 학습 완료 ({time.perf_counter() - started:.1f}초, n-gram {len(model.features)}개)")
+
+    preds = model.predict_labels([x["question"] for x in val_data])
+    accuracy = sum(p == x["label"] for p, x in zip(preds, val_data)) / len(val_data)
+    model.save(output)
+    print(f"💾 {output} 저장 ({os.path.getsize(output) / 1024:.1f} KB), 검증 정확도 {accuracy:.2%}")
+    return model
+
+
+def report(model_path, teacher=None, onnx=None):
+    """검증 분할에서 키워드 라우팅 / 경량 모델 / 전체 분류기의 정확도·지연 비교"""
+    _, val_data = split_data()
+    questions = [x["question"] for x in val_data]
+    labels = [x["label"] for x in val_data]
+
+    started = time.perf_counter()
+    tiny = TinyClassifier.load(model_path)
+    load_ms = (time.perf_counter() - started) * 1000
+
+    router = IntentRouter()
+    runners = [
+        ("키워드 라우팅", lambda q: keyword_label(router.route(q)), 0.0),
+        ("경량 모델", lambda q: tiny.predict_labels([q])[0], load_ms),
+    ]
+    for name, path in (("QClassifier", teacher), ("QClassifier ONNX", onnx)):
+        if path:
+            from campus_classifier_onnx import load_runtime_classifier
+            started = time.perf_counter()
+            classifier = load_runtime_classifier(path)
+            elapsed = (time.perf_counter() - started) * 1000
+            runners.append((name, lambda q, c=classifier: c.predict_labels([q])[0], elapsed))
+
+    print(f"📊 질문 라우터 비교 (검증 {len(questions)}문항, 모델 {os.path.getsize(model_path) / 1024:.1f} KB)")
+    print("=" * 70)
+    print(f"  {'방식':<16} {'정확도':>8} {'p50 ms':>9} {'p95 ms':>9} {'로드 ms':>10}")
+    for name, predict, load_time in runners:
+        predict(questions[0])  # 워밍업
+        preds, latencies = [], []
+        for question in questions:
+            started = time.perf_counter()
+            preds.append(predict(question))
+            latencies.append((time.perf_counter() - started) * 1000)
+        latencies.sort()
+        accuracy = sum(p == y for p, y in zip(preds, labels)) / len(labels)
+        p50 = latencies[len(latencies) // 2]
+        p95 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+        print(f"  {name:<16} {accuracy:>8.2%} {p50:>9.3f} {p95:>9.3f} {load_time:>10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="경량 질문 분류기")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    train_parser = sub.add_parser("train", help="train.json으로 학습 (teacher가 있으면 증류)")
+    train_parser.add_argument("--output", required=True)
+    train_parser.add_argument("--teacher", default=None, help="QClassifier 체크포인트 또는 ONNX 폴더")
+    train_parser.add_argument("--alpha", type=float, default=0.5, help="정답 레이블 비중")
+    train_parser.add_argument("--epochs", type=int, default=40)
+
+    report_parser = sub.add_parser("report", help="정확도/지연 비교")
+    report_parser.add_argument("--model", required=True)
+    report_parser.add_argument("--teacher", default=None)
+    report_parser.add_argument("--onnx", default=None)
+
+    args = parser.parse_args()
+    if args.command == "train":
+        train(args.output, args.teacher, args.alpha, args.epochs)
+    else:
+        report(args.model, args.teacher, args.onnx)
+
+
+if __name__ == "__main__":
+    main()
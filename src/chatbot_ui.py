@@ -27,6 +27,9 @@ def initialize_chatbot():
             except Exception as fallback_error:
                 print(f"❌ Fallback 모델도 실패: {fallback_error}")
                 chatbot_model = None
+        # 식단/공지사항 백그라운드 갱신 시작 (첫 갱신이 끝난 뒤 답변 시작, 첫 질문 때 로드해도 동일)
+        if chatbot_model is not None:
+            chatbot_model.knowledge_base.start_prefetch()
     return chatbot_model
 
 
@@ -200,12 +203,16 @@ def launch_app():
     except Exception as e:
         print(f"⚠️ 백그라운드 로드 실패 (첫 질문 시 로드됩니다): {e}")
 
-    demo.launch(
-        share=True,  # 공유 링크 생성
-        server_name="127.0.0.1",  # 외부 접속 허용
-        server_port=7860,  # 포트 설정
-        show_error=True
-    )
+    try:
+        demo.launch(
+            share=True,  # 공유 링크 생성
+            server_name="127.0.0.1",  # 외부 접속 허용
+            server_port=7860,  # 포트 설정
+            show_error=True
+        )
+    finally:
+        if chatbot_model is not None:
+            chatbot_model.knowledge_base.stop_prefetch()
 
 
 if __name__ == "__main__":
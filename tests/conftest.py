@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""테스트 공용 설정 (src 경로, 정적 지식 로더)"""
+import ast
+import os
+import sys
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "src")
+sys.path.insert(0, SRC_DIR)
+
+
+def load_static_knowledge():
+    """chatbot_model.py의 static_knowledge dict 리터럴 (torch 없이 소스에서 읽음)"""
+    with open(os.path.join(SRC_DIR, "chatbot_model.py"), "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Assign) and any(getattr(target, "attr", None) == "static_knowledge"
+                                                for target in node.targets):
+            return ast.literal_eval(node.value)
+    raise AssertionError("static_knowledge를 찾을 수 없습니다")
@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""생성 답변 캐시(AnswerCache) 키/저장 검사"""
+import os
+
+from campus_answer_cache import AnswerCache, cache_namespace, normalize_question
+
+
+def test_normalize_question_ignores_spacing_case_and_trailing_marks():
+    assert normalize_question("  학식   뭐야?? ") == normalize_question("학식 뭐야")
+    assert normalize_question("ＣＮＵ 셔틀") == normalize_question("cnu 셔틀")
+
+
+def test_key_changes_with_context_and_variant():
+    cache = AnswerCache()
+    base = cache.key("오늘 학식 뭐야?", "식단 A", "dining::2025-06-18")
+    assert cache.key("오늘 학식 뭐야", "식단 A", "dining::2025-06-18") == base
+    assert cache.key("오늘 학식 뭐야", "식단 B", "dining::2025-06-18") != base
+    assert cache.key("오늘 학식 뭐야", "식단 A", "dining::2025-06-19") != base  # 날짜가 바뀌면 다른 답변
+
+
+def test_namespace_depends_on_prompt_and_profiles():
+    assert cache_namespace("model", "prompt", 2, "profiles") != cache_namespace("model", "prompt", 3, "profiles")
+    assert cache_namespace("model", "prompt", 2, "profiles") == cache_namespace("model", "prompt", 2, "profiles")
+
+
+def test_disk_cache_is_shared_per_namespace(tmp_path):
+    path = os.path.join(tmp_path, "answers.db")
+    writer = AnswerCache(path=path, namespace="a")
+    key = writer.key("졸업 학점?", "130학점")
+    writer.set(key, "130학점입니다.")
+
+    assert AnswerCache(path=path, namespace="a").get(key) == "130학점입니다."
+    assert AnswerCache(path=path, namespace="b").get(key) is None
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""TTLCache 만료/LRU/통계 및 cache_path 환경 변수 검사"""
+import os
+import time
+
+from campus_cache import TTLCache, cache_path
+
+
+def test_expired_entry_is_removed():
+    cache = TTLCache(ttl=0.05)
+    cache.set(("menu", "2025.06.18"), "식단")
+    assert cache.get(("menu", "2025.06.18")) == "식단"
+    time.sleep(0.1)
+    assert cache.get(("menu", "2025.06.18")) is None
+    assert ("menu", "2025.06.18") not in cache
+    assert len(cache) == 0
+
+
+def test_per_entry_ttl_overrides_default():
+    cache = TTLCache(ttl=1800)
+    cache.set("short", 1, ttl=0.05)
+    cache.set("long", 2)
+    time.sleep(0.1)
+    assert cache.get("short") is None
+    assert cache.get("long") == 2
+
+
+def test_lru_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # a를 최근 사용으로
+    cache.set("c", 3)
+    assert "b" not in cache
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    assert cache.evictions == 1
+
+
+def test_get_or_load_does_not_cache_none():
+    cache = TTLCache()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return None
+
+    assert cache.get_or_load("notice", loader) is None
+    assert cache.get_or_load("notice", loader) is None
+    assert len(calls) == 2
+    assert cache.get_or_load("notice", lambda: ["공지"]) == ["공지"]
+    assert cache.get_or_load("notice", loader) == ["공지"]
+    assert len(calls) == 2
+
+
+def test_invalidate_and_stats():
+    cache = TTLCache()
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.get("missing")
+    cache.invalidate("a")
+    assert "a" not in cache and "b" in cache
+    cache.invalidate()
+    stats = cache.stats()
+    assert stats["size"] == 0
+    assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 1, 0.5)
+
+
+def test_cache_path_follows_env_at_call_time(tmp_path, monkeypatch):
+    monkeypatch.setenv("CAMPUS_CACHE_DIR", str(tmp_path))
+    assert cache_path("campus_snapshot.db") == os.path.join(str(tmp_path), "campus_snapshot.db")
+    monkeypatch.delenv("CAMPUS_CACHE_DIR")
+    assert cache_path("x").endswith(os.path.join("cache", "x"))
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""학사일정 색인(CalendarIndex.relevant) 질문별 일정 선택 검사"""
+from datetime import date
+
+import pytest
+from conftest import load_static_knowledge
+
+from campus_calendar import CalendarIndex, extract_events
+from campus_dates import DateParser
+
+TODAY = date(2025, 6, 18)  # 1학기 기말고사 기간
+
+
+@pytest.fixture(scope="module")
+def index():
+    return CalendarIndex(extract_events(load_static_knowledge()["academic_schedule"]))
+
+
+def relevant(index, question):
+    return index.relevant(question, DateParser().parse(question, TODAY), TODAY)
+
+
+def test_date_and_kind_without_match_falls_back_to_next_event(index):
+    events = relevant(index, "지금 수강신청 기간이야?")
+    assert events and all(event.kind in ("수강신청", "예비수강신청") for event in events)
+    assert all(event.end >= TODAY for event in events)
+
+
+def test_date_and_kind_with_match_keeps_that_day(index):
+    events = relevant(index, "오늘 기말고사 맞아?")
+    assert [event.kind for event in events] == ["기말고사"]
+
+
+def test_month_only_question_uses_whole_month(index):
+    events = relevant(index, "12월 학사일정 알려줘")
+    assert events
+    assert all(event.start <= date(2025, 12, 31) and event.end >= date(2025, 12, 1) for event in events)
+
+
+def test_month_and_kind(index):
+    events = relevant(index, "12월 기말고사 언제야")
+    assert [event.kind for event in events] == ["기말고사"]
+    assert events[0].start.month == 12
@@ -0,0 +1,23 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""load_runtime_classifier 경량 모델 경로 검사 (torch/transformers 없이 로드)"""
+import os
+import sys
+
+from campus_classifier_onnx import load_runtime_classifier
+from campus_router import LABELS
+from campus_tiny_classifier import TinyClassifier
+
+QUESTIONS = ["졸업 학점 몇 점이야", "장학금 공지 떴어?", "수강신청 언제야", "오늘 학식 메뉴 뭐야", "셔틀 막차 몇 시야"]
+
+
+def test_tiny_model_loads_without_torch(tmp_path):
+    targets = [[float(i == label) for i in range(len(LABELS))] for label in range(len(LABELS))]
+    path = os.path.join(tmp_path, "tiny.json.gz")
+    TinyClassifier.fit(QUESTIONS, targets, epochs=20).save(path)
+
+    classifier = load_runtime_classifier(path)
+
+    assert isinstance(classifier, TinyClassifier)
+    assert classifier.predict_labels(QUESTIONS) == list(range(len(LABELS)))
+    assert "torch" not in sys.modules and "transformers" not in sys.modules
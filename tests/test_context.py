@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""ContextPacker 토큰 예산 채우기 / 캐시한 토큰 id 이어 붙이기 검사"""
+from campus_context import ContextBlock, ContextPacker
+
+HEADER = "=== 정보 ===\n\n"
+
+
+class CharTokenizer:
+    """글자 하나 = 토큰 하나인 가짜 토크나이저 (encode 호출 수 기록)"""
+
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, text, add_special_tokens=False):
+        self.calls.append(text)
+        return [ord(ch) for ch in text]
+
+
+def test_pack_ids_matches_packed_text():
+    packer = ContextPacker(CharTokenizer(), budget=1000)
+    blocks = [ContextBlock("식단정보", ["중식 돈까스\n", "석식 카레\n"]), ContextBlock("최신공지", ["1. 휴강 안내\n"])]
+
+    text, ids = packer.pack_ids(HEADER, blocks)
+
+    assert text == packer.pack(HEADER, blocks)
+    assert ids == [ord(ch) for ch in text]
+    assert "【식단정보】\n중식 돈까스\n석식 카레\n\n【최신공지】\n1. 휴강 안내\n\n" in text
+
+
+def test_warmed_lines_are_not_tokenized_again():
+    tokenizer = CharTokenizer()
+    packer = ContextPacker(tokenizer, budget=1000)
+    lines = ["• 졸업학점: 130\n", "• 전공학점: 66\n"]
+    packer.warm(lines)
+    packer.pack_ids(HEADER, [ContextBlock("졸업요건_정보", lines)])
+    tokenizer.calls.clear()
+
+    packer.pack_ids(HEADER, [ContextBlock("졸업요건_정보", lines)])
+
+    assert tokenizer.calls == []
+    assert packer.stats()["static_fragments"] == 2
+
+
+def test_budget_skips_lines_round_robin_without_cutting():
+    packer = ContextPacker(CharTokenizer())
+    blocks = [ContextBlock("A", ["a" * 10 + "\n", "a" * 10 + "\n"]), ContextBlock("B", ["b" * 10 + "\n"])]
+    section = len("【A】\n") + len("\n")
+    budget = len(HEADER) + 2 * (section + 11)
+
+    text, ids = packer.pack_ids(HEADER, blocks, budget)
+
+    # 각 섹션 1순위 줄만 들어가고 A의 두 번째 줄은 통째로 빠짐
+    assert text.count("a" * 10) == 1 and "b" * 10 in text
+    assert len(ids) <= budget
+    assert packer.dropped_lines == 1
+
+
+def test_empty_blocks_give_header_only():
+    packer = ContextPacker(CharTokenizer())
+    text, ids = packer.pack_ids(HEADER, [ContextBlock("A", [])])
+    assert text == HEADER
+    assert ids == [ord(ch) for ch in HEADER]
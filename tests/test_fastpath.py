@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""빠른 경로(FastPathEngine) 질문별 답변/통과 검사
+
+chatbot_model은 torch/transformers를 불러오므로 정적 지식 dict만 소스에서 읽고 (conftest)
+나머지는 실제 모듈(라우터, 날짜 파서, 셔틀 시간표)로 지식 베이스를 구성한다.
+"""
+import os
+from datetime import datetime
+
+import pytest
+from conftest import SRC_DIR, load_static_knowledge
+
+from campus_dates import DateParser
+from campus_fastpath import FastPathEngine
+from campus_parser import parse_menu_table
+from campus_router import LABELS, IntentRouter
+from campus_shuttle import ShuttleSchedule
+
+NOW = datetime(2025, 6, 18, 10, 5)  # 수요일, 학기 중
+MENU_FIXTURE = os.path.join(SRC_DIR, "..", "data", "fixtures", "menu_2025.06.18.html")
+
+
+class KnowledgeBase:
+    """FastPathEngine이 쓰는 지식 베이스 속성만 갖춘 구성 (분류기 없이 키워드 주제)"""
+
+    def __init__(self):
+        self.static_knowledge = load_static_knowledge()
+        self.router = IntentRouter()
+        self.date_parser = DateParser()
+        self.shuttle_schedule = ShuttleSchedule(self.static_knowledge["shuttle"],
+                                                self.static_knowledge["academic_schedule"])
+        with open(MENU_FIXTURE, "rb") as f:
+            self.meals = parse_menu_table(f.read())
+        self.menu_dates = []
+
+    def predict_topics(self, question, route):
+        return {label for label in LABELS if route.has(label)}
+
+    def get_menu(self, date_str=None):
+        self.menu_dates.append(date_str)
+        return {"status": "success", "date": "2025-06-18", "meals": self.meals}
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return FastPathEngine(KnowledgeBase())
+
+
+@pytest.mark.parametrize("question", [
+    "셔틀 운행 기간 언제야?",
+    "셔틀 언제까지 운행해?",
+    "공휴일에 셔틀 운행해?",
+    "셔틀 어린이날에도 운행해?",
+    "다음 학기 셔틀 언제부터 운행해?",
+    "셔틀 요금 있어?",
+    "셔틀 이번 학기 언제까지 운행해?",
+    "수능날 셔틀 첫차",
+    "학생증 없이 셔틀 탈 수 있어?",
+    "다음 학기 시간표 열람은 언제 가능해?",
+])
+def test_shuttle_questions_outside_timetable_go_to_model(engine, question):
+    assert engine.answer(question, NOW) is None
+
+
+@pytest.mark.parametrize("question, expected", [
+    ("셔틀버스 몇 시에 끝나?", "막차는 17:30"),
+    ("오늘 마지막 셔틀이 몇 시야", "막차는 17:30"),
+    ("오늘 첫 셔틀버스 몇 시에 출발해?", "첫차는 08:30"),
+    ("다음 셔틀까지 얼마나 남았어?", "다음 교내 순환 셔틀은 10:30"),
+    ("11월 13일 셔틀 첫차", "첫차는 10:30"),
+    ("토요일에도 셔틀 운행해?", "미운행일"),
+])
+def test_shuttle_timetable_answers(engine, question, expected):
+    intent, text = engine.answer(question, NOW)
+    assert intent == "shuttle"
+    assert expected in text
+
+
+@pytest.mark.parametrize("question, intent, expected", [
+    ("오늘 2학 점심 메뉴 뭐야", "menu", "제2학생회관 중식"),
+    ("졸업에 필요한 최소 학점은?", "graduation_credits", "130학점"),
+    ("생협 전화번호 알려줘", "contacts", "042-821-5890"),
+])
+def test_other_templates(engine, question, intent, expected):
+    result = engine.answer(question, NOW)
+    assert result is not None and result[0] == intent
+    assert expected in result[1]
+
+
+@pytest.mark.parametrize("question", ["입학식 날짜 알려줘", "메뉴 다 떨어질 수 있어?", "학식 가격 얼마야"])
+def test_non_menu_questions_go_to_model(engine, question):
+    assert engine.answer(question, NOW) is None
+
+
+@pytest.mark.parametrize("question, date_str", [
+    ("오늘 2학 점심 메뉴 뭐야", "2025.06.18"),
+    ("2학 점심 메뉴 뭐야", "2025.06.18"),
+    ("내일 2학 점심 메뉴 뭐야", "2025.06.19"),
+])
+def test_menu_date_follows_now(engine, question, date_str):
+    engine.kb.menu_dates.clear()
+    engine.answer(question, NOW)
+    assert engine.kb.menu_dates == [date_str]
+
+
+@pytest.mark.parametrize("question, expected", [
+    ("학사지원과 연락처 알려줘", "042-821-5025"),
+    ("졸업요건 문의처 어디야", "042-821-5025"),
+    ("셔틀버스 문의 전화번호", "042-821-5114"),
+])
+def test_contacts_within_department_topics(engine, question, expected):
+    intent, text = engine.answer(question, NOW)
+    assert intent == "contacts"
+    assert expected in text
+
+
+def test_contacts_with_other_topic_go_to_model(engine):
+    assert engine.answer("셔틀 시간표랑 학생지원과 번호", NOW) is None
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""StaleWhileRevalidate / CircuitBreaker 동작 검사"""
+import os
+import time
+
+from campus_cache import TTLCache
+from campus_resilience import CircuitBreaker, Loaded, StaleWhileRevalidate
+from campus_snapshot_db import CampusSnapshotDB
+
+
+def test_loaded_value_is_unwrapped_and_cached_for_remaining_ttl():
+    cache = TTLCache(ttl=1800)
+    swr = StaleWhileRevalidate(cache)
+    menu = {"status": "success", "meals": []}
+
+    assert swr.get(("menu", "2025.06.18"), lambda: Loaded(menu, 0.05)) is menu
+    assert cache.get(("menu", "2025.06.18")) is menu
+    assert swr.last_good[("menu", "2025.06.18")] is menu
+    time.sleep(0.1)
+    assert cache.get(("menu", "2025.06.18")) is None  # 남은 TTL이 지나면 만료
+
+
+def test_background_refresh_unwraps_loaded():
+    cache = TTLCache(ttl=1800)
+    swr = StaleWhileRevalidate(cache)
+    key = ("notice", "latest")
+    swr.last_good[key] = [{"title": "이전"}]
+    fresh = [{"title": "새 공지"}]
+
+    assert swr.get(key, lambda: Loaded(fresh, 60)) == [{"title": "이전"}]  # stale 반환 + 뒤에서 갱신
+    swr._executor.shutdown(wait=True)
+    assert cache.get(key) is fresh
+    assert swr.last_good[key] is fresh
+
+
+def test_invalid_value_is_not_cached():
+    cache = TTLCache()
+    swr = StaleWhileRevalidate(cache)
+    error = {"status": "error"}
+    assert swr.get("k", lambda: error, is_valid=lambda v: v["status"] == "success") is error
+    assert cache.get("k") is None and "k" not in swr.last_good
+    assert swr.stats()["refresh_failures"] == 1
+
+
+def test_load_missing_false_and_put_with_ttl():
+    cache = TTLCache(ttl=1800)
+    swr = StaleWhileRevalidate(cache)
+    assert swr.get("k", lambda: "loaded", load_missing=False) is None
+    swr.put("k", "value", ttl=0.05)
+    assert swr.get("k", lambda: "loaded", load_missing=False) == "value"
+    time.sleep(0.1)
+    assert cache.get("k") is None
+    assert swr.last_good["k"] == "value"
+
+
+def test_sqlite_snapshot_put_with_remaining_ttl(tmp_path):
+    # cached_menu의 SQLite 경로: 저장소 스냅샷을 수집 후 남은 시간만큼만 신선한 값으로
+    db = CampusSnapshotDB(os.path.join(tmp_path, "snapshot.db"))
+    db.save_menu({"status": "success", "date": "2025-06-18", "source": "fixture",
+                  "meals": [{"meal_type": "중식", "target": "학생", "cafeteria": "제2학생회관", "menu": ["밥"]}]})
+    menu, fetched_at = db.menu_snapshot("2025-06-18", max_age=1800)
+
+    cache = TTLCache(ttl=1800)
+    swr = StaleWhileRevalidate(cache)
+    swr.put(("menu", "2025.06.18"), menu, ttl=max(1800 - (time.time() - fetched_at), 0))
+    assert swr.get(("menu", "2025.06.18"), lambda: None, load_missing=False)["meals"][0]["menu"] == ["밥"]
+
+
+def test_circuit_breaker_opens_and_half_opens():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+    breaker.record_failure()
+    assert breaker.allow()
+    breaker.record_failure()
+    assert breaker.stats()["state"] == "open" and not breaker.allow()
+    time.sleep(0.06)
+    assert breaker.allow()  # half_open 시험 요청 1건
+    assert not breaker.allow()
+    breaker.record_success()
+    assert breaker.stats()["state"] == "closed" and breaker.allow()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""CampusSnapshotDB 식단/공지 저장과 NoticeStore 중복 제거·보관 개수 검사"""
+import os
+import time
+
+import pytest
+
+from campus_notice_store import NoticeStore, notice_key
+from campus_snapshot_db import CampusSnapshotDB
+
+MENU = {
+    "status": "success",
+    "date": "2025-06-18",
+    "source": "fixture",
+    "meals": [
+        {"meal_type": "중식", "target": "학생", "cafeteria": "제2학생회관", "menu": ["돈까스", "4,000원"]},
+        {"meal_type": "석식", "target": "학생", "cafeteria": "제3학생회관", "menu": ["카레"]},
+    ],
+}
+
+
+def notice(i):
+    return {"id": str(i), "title": f"공지 {i}", "writer": "학사지원과", "date": "2025.06.18"}
+
+
+@pytest.fixture
+def db(tmp_path):
+    return CampusSnapshotDB(os.path.join(tmp_path, "snapshot.db"))
+
+
+def test_menu_round_trip_keeps_meal_order(db):
+    db.save_menu(MENU)
+    menu, fetched_at = db.menu_snapshot("2025-06-18")
+    assert menu["meals"] == MENU["meals"]
+    assert menu["source"] == "fixture"
+    assert time.time() - fetched_at < 5
+    assert db.menu_dates() == ["2025-06-18"]
+    assert db.menu_dates(since="2025-06-19") == []
+
+
+def test_menu_older_than_max_age_is_ignored(db):
+    db.save_menu(MENU)
+    time.sleep(0.05)
+    assert db.load_menu("2025-06-18", max_age=0.01) is None
+    assert db.load_menu("2025-06-18", max_age=60) is not None
+    assert db.load_menu("2025-06-19") is None
+
+
+def test_saving_menu_again_replaces_rows(db):
+    db.save_menu(MENU)
+    db.save_menu(dict(MENU, meals=MENU["meals"][:1]))
+    assert db.load_menu("2025-06-18")["meals"] == MENU["meals"][:1]
+
+
+def test_notices_before_first_save_are_missing(db):
+    assert db.notices_snapshot() is None
+    db.save_notices([], notice_key)
+    assert db.load_notices() == []
+
+
+def test_notice_store_adds_newest_first_and_skips_known(db):
+    store = NoticeStore(db)
+    assert store.add([notice(2), notice(1)]) == 2
+    # 다음 수집: 새 공지 3 + 이미 본 2 (페이지가 밀려 3이 두 번 들어옴)
+    assert store.add([notice(3), notice(3), notice(2)]) == 1
+    assert [item["title"] for item in store.latest()] == ["공지 3", "공지 2", "공지 1"]
+    assert len(store) == 3
+    assert store.is_known(notice(1)) and not store.is_known(notice(4))
+    assert store.unseen([notice(1), notice(4)]) == [notice(4)]
+
+
+def test_notice_store_keeps_max_items_newest(db):
+    store = NoticeStore(db, max_items=2)
+    store.add([notice(1)])
+    store.add([notice(2)])
+    store.add([notice(3)])
+    assert [item["title"] for item in store.latest()] == ["공지 3", "공지 2"]
+    assert len(store) == 2
+
+
+def test_notices_are_shared_between_stores_on_same_file(tmp_path):
+    path = os.path.join(tmp_path, "snapshot.db")
+    NoticeStore(CampusSnapshotDB(path)).add([notice(1)])
+    other = NoticeStore(CampusSnapshotDB(path))
+    assert other.add([notice(1), notice(2)]) == 1
+    assert len(other) == 2